@@ -134,6 +134,12 @@ class AppConfig:
     slow_repository_ms: int = field(
         default_factory=lambda: int(_env("APP_SLOW_REPOSITORY_MS", "250"))
     )
+    orchestrator_concurrency: int = field(
+        default_factory=lambda: int(_env("APP_ORCHESTRATOR_CONCURRENCY", "8"))
+    )
+    link_fast_path: bool = field(
+        default_factory=lambda: _env("APP_LINK_FAST_PATH", "false").lower() == "true"
+    )
 
     @property
     def is_development(self) -> bool:
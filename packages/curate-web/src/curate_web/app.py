@@ -11,6 +11,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import jinja2
 import uvicorn
 from azure.core.exceptions import HttpResponseError, ServiceRequestError
 from azure.monitor.opentelemetry import configure_azure_monitor
@@ -117,6 +118,23 @@ def _install_request_diagnostics_middleware(app: FastAPI, settings: Settings) ->
                 logger.debug(message, *args)
 
 
+def _create_templates(directory: Path, *, auto_reload: bool) -> Jinja2Templates:
+    """Build the template renderer with every template compiled up front.
+
+    Outside development templates never change on disk, so Jinja skips the
+    per-render mtime check and keeps all compiled templates cached.
+    """
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(directory),
+        autoescape=True,
+        auto_reload=auto_reload,
+        cache_size=-1,
+    )
+    for name in env.list_templates():
+        env.get_template(name)
+    return Jinja2Templates(env=env)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Manage application lifecycle — initialize DB and storage."""
@@ -133,7 +151,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         raise SystemExit(1) from None
     app.state.cosmos = cosmos
     app.state.settings = settings
-    app.state.templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+    app.state.templates = _create_templates(
+        TEMPLATES_DIR, auto_reload=settings.app.is_development
+    )
 
     editions_repo = EditionRepository(cosmos.database)
 
@@ -19,12 +19,22 @@ class MSALAuth:
     SCOPE: ClassVar[list[str]] = ["User.Read"]
 
     def __init__(self, config: EntraConfig) -> None:
-        """Initialize the MSAL client with Entra ID configuration."""
+        """Initialize with Entra ID configuration."""
         self._config = config
-        self._app = msal.ConfidentialClientApplication(
-            client_id=config.client_id,
-            client_credential=config.client_secret,
-            authority=config.authority,
+        # Only authority discovery responses are shared between requests.
+        self._http_cache: dict[Any, Any] = {}
+
+    def _client(self) -> msal.ConfidentialClientApplication:
+        """Build a client whose token cache lives only as long as one call.
+
+        A shared client would collect every user's tokens in one in-memory
+        cache that is never evicted.
+        """
+        return msal.ConfidentialClientApplication(
+            client_id=self._config.client_id,
+            client_credential=self._config.client_secret,
+            authority=self._config.authority,
+            http_cache=self._http_cache,
         )
 
     def get_auth_flow(self) -> dict[str, Any]:
@@ -33,7 +43,7 @@ class MSALAuth:
         Returns the full flow dict (for session storage).
         """
         logger.info("Auth flow started")
-        return self._app.initiate_auth_code_flow(
+        return self._client().initiate_auth_code_flow(
             scopes=self.SCOPE,
             redirect_uri=self._config.redirect_uri,
         )
@@ -46,7 +56,7 @@ class MSALAuth:
         Returns the token result containing access_token and
         id_token_claims, or None on failure.
         """
-        result = self._app.acquire_token_by_auth_code_flow(flow, auth_response)
+        result = self._client().acquire_token_by_auth_code_flow(flow, auth_response)
         if "error" in result:
             logger.warning("Auth flow failed — error=%s", result.get("error"))
             return None
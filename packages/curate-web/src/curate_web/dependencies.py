@@ -11,29 +11,42 @@ from curate_common.database.repositories.links import LinkRepository
 from curate_common.database.repositories.revisions import RevisionRepository
 
 if TYPE_CHECKING:
+    from curate_common.database.repositories.base import BaseRepository
     from curate_web.runtime import WebRuntime
 
 
+def _repository[R: BaseRepository](runtime: WebRuntime, repo_class: type[R]) -> R:
+    """Return the runtime's shared repository of ``repo_class``.
+
+    Repositories hold only a container client, so one instance per runtime
+    serves every request instead of being rebuilt on each call.
+    """
+    repo = runtime.repositories.get(repo_class)
+    if repo is None:
+        repo = runtime.repositories[repo_class] = repo_class(runtime.cosmos.database)
+    return repo
+
+
 def get_agent_run_repository(runtime: WebRuntime) -> AgentRunRepository:
     """Return an agent-run repository bound to the runtime database."""
-    return AgentRunRepository(runtime.cosmos.database)
+    return _repository(runtime, AgentRunRepository)
 
 
 def get_edition_repository(runtime: WebRuntime) -> EditionRepository:
     """Return an edition repository bound to the runtime database."""
-    return EditionRepository(runtime.cosmos.database)
+    return _repository(runtime, EditionRepository)
 
 
 def get_feedback_repository(runtime: WebRuntime) -> FeedbackRepository:
     """Return a feedback repository bound to the runtime database."""
-    return FeedbackRepository(runtime.cosmos.database)
+    return _repository(runtime, FeedbackRepository)
 
 
 def get_link_repository(runtime: WebRuntime) -> LinkRepository:
     """Return a link repository bound to the runtime database."""
-    return LinkRepository(runtime.cosmos.database)
+    return _repository(runtime, LinkRepository)
 
 
 def get_revision_repository(runtime: WebRuntime) -> RevisionRepository:
     """Return a revision repository bound to the runtime database."""
-    return RevisionRepository(runtime.cosmos.database)
+    return _repository(runtime, RevisionRepository)
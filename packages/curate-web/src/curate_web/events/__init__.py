@@ -35,8 +35,15 @@ class EventManager:
             cls.instance = cls()
         return cls.instance
 
+    def has_subscribers(self) -> bool:
+        """Return True when at least one SSE client is connected."""
+        return bool(self.queues)
+
     async def publish(self, event_type: str, data: dict[str, Any] | str) -> None:
         """Broadcast an event to all connected SSE clients."""
+        if not self.has_subscribers():
+            logger.debug("SSE publish skipped event=%s clients=0", event_type)
+            return
         message = {
             "event": event_type,
             "data": json.dumps(data) if isinstance(data, dict) else data,
@@ -8,18 +8,28 @@ from fastapi import APIRouter, Request
 from fastapi.responses import RedirectResponse
 
 from curate_web.auth.msal_auth import MSALAuth
-from curate_web.runtime import get_runtime
+from curate_web.runtime import WebRuntime, get_runtime
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 logger = logging.getLogger(__name__)
 
 
+def _get_auth(runtime: WebRuntime) -> MSALAuth:
+    """Return the runtime's MSAL helper, creating it on first sign-in.
+
+    The helper keeps the resolved Entra authority metadata, so discovery is
+    done once per process rather than on every login and callback.
+    """
+    if runtime.msal_auth is None:
+        runtime.msal_auth = MSALAuth(runtime.settings.entra)
+    return runtime.msal_auth
+
+
 @router.get("/login")
 async def login(request: Request) -> RedirectResponse:
     """Redirect to Microsoft Entra ID login page."""
-    settings = get_runtime(request).settings
-    auth = MSALAuth(settings.entra)
+    auth = _get_auth(get_runtime(request))
     flow = auth.get_auth_flow()
     request.session["auth_flow"] = flow
     return RedirectResponse(flow["auth_uri"])
@@ -28,8 +38,7 @@ async def login(request: Request) -> RedirectResponse:
 @router.get("/callback")
 async def callback(request: Request) -> RedirectResponse:
     """Handle the OAuth callback from Entra ID."""
-    settings = get_runtime(request).settings
-    auth = MSALAuth(settings.entra)
+    auth = _get_auth(get_runtime(request))
     flow = request.session.pop("auth_flow", {})
     result = auth.complete_auth(flow, dict(request.query_params))
     if result:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 import curate_web.services.editions as edition_svc
@@ -61,6 +61,9 @@ async def edition_detail(request: Request, edition_id: str) -> HTMLResponse:
     return runtime.templates.TemplateResponse(
         "workspace.html",
         {"request": request, **data},
+        status_code=(
+            status.HTTP_404_NOT_FOUND if data["edition"] is None else status.HTTP_200_OK
+        ),
     )
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import Annotated
@@ -48,10 +49,14 @@ async def settings_page(request: Request) -> HTMLResponse:
     personal_memories: list = []
 
     if memory_service and memory_enabled:
-        project_memories = await memory_service.list_memories("project-editorial")
         user_scope = _get_user_scope(request)
-        if user_scope:
-            personal_memories = await memory_service.list_memories(user_scope)
+        scopes = (
+            ["project-editorial", user_scope] if user_scope else ["project-editorial"]
+        )
+        project_memories, *rest = await asyncio.gather(
+            *(memory_service.list_memories(scope) for scope in scopes)
+        )
+        personal_memories = rest[0] if rest else []
 
     # Token usage, health checks, and app info
     import platform  # noqa: PLC0415
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from curate_common.database.client import CosmosClient
     from curate_common.events import EventPublisher
     from curate_common.storage.blob import BlobStorageClient
+    from curate_web.auth.msal_auth import MSALAuth
     from curate_web.events import EventManager
     from curate_web.events.consumer import ServiceBusConsumer
     from curate_web.services.memory import MemoryService
@@ -34,6 +35,8 @@ class WebRuntime:
     event_publisher: EventPublisher | None = None
     event_consumer: ServiceBusConsumer | None = None
     realtime_enabled: bool = False
+    repositories: dict[type, Any] = field(default_factory=dict)
+    msal_auth: MSALAuth | None = None
 
 
 def get_runtime(request: Request) -> WebRuntime:
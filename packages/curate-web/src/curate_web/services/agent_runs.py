@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 from typing import TYPE_CHECKING, Any
 
 from curate_common.models.agent_run import AgentRun, AgentStage
@@ -19,12 +21,10 @@ def group_runs_by_invocation(runs: list[AgentRun]) -> list[list[AgentRun]]:
     if not runs:
         return []
 
-    groups: list[list[AgentRun]] = []
-    for run in runs:
-        if run.stage == "orchestrator" or not groups:
-            groups.append([])
-        groups[-1].append(run)
-    return groups
+    # Slice between orchestrator boundaries rather than appending run by run.
+    starts = [i for i, run in enumerate(runs) if i and run.stage == "orchestrator"]
+    bounds = [0, *starts, len(runs)]
+    return [runs[start:end] for start, end in itertools.pairwise(bounds)]
 
 
 def _run_to_dict(run: AgentRun) -> dict[str, Any]:
@@ -57,10 +57,12 @@ async def get_agents_page_data(
         AgentStage.EDIT,
         AgentStage.PUBLISH,
     ]
+    results = await asyncio.gather(
+        *(runs_repo.list_recent_by_stage(stage, limit=5) for stage in stages)
+    )
     runs_by_stage: dict[str, list[AgentRun]] = {}
     running_stages: set[str] = set()
-    for stage in stages:
-        stage_runs = await runs_repo.list_recent_by_stage(stage, limit=5)
+    for stage, stage_runs in zip(stages, results, strict=True):
         runs_by_stage[stage.value] = stage_runs
         if any(r.status == "running" for r in stage_runs):
             running_stages.add(stage.value)
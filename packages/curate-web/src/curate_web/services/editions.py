@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import TYPE_CHECKING, Any
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
     from curate_common.database.repositories.revisions import RevisionRepository
     from curate_common.events import EventPublisher
     from curate_common.models.link import Link
+    from curate_common.models.revision import Revision
 
 logger = logging.getLogger(__name__)
 
@@ -58,14 +60,18 @@ async def get_edition_detail(
 ) -> dict[str, Any]:
     """Fetch edition, links, and agent runs and assemble a detail dict."""
     started_at = time.monotonic()
-    edition = await editions_repo.get(edition_id, edition_id)
-    links: list[Link] = await links_repo.get_by_edition(edition_id) if edition else []
+    edition, links = await asyncio.gather(
+        editions_repo.get(edition_id, edition_id),
+        links_repo.get_by_edition(edition_id),
+    )
+    if edition is None:
+        links = []
 
-    trigger_ids = [link.id for link in links]
+    links_by_id = {link.id: link for link in links}
+    trigger_ids = list(links_by_id)
     agent_runs = (
         await agent_runs_repo.get_by_triggers(trigger_ids) if trigger_ids else []
     )
-    links_by_id = {link.id: link for link in links}
 
     logger.info(
         "Edition detail assembled — edition=%s exists=%s links=%d "
@@ -86,6 +92,15 @@ async def get_edition_detail(
     }
 
 
+async def _list_revisions(
+    edition_id: str, revisions_repo: RevisionRepository | None
+) -> list[Revision]:
+    """Return the edition's revisions, or none when no repository is wired."""
+    if revisions_repo is None:
+        return []
+    return await revisions_repo.list_by_edition(edition_id)
+
+
 async def get_workspace_data(
     edition_id: str,
     editions_repo: EditionRepository,
@@ -96,12 +111,25 @@ async def get_workspace_data(
 ) -> dict[str, Any]:
     """Fetch all data needed for the edition workspace view."""
     started_at = time.monotonic()
-    edition = await editions_repo.get(edition_id, edition_id)
-    links: list[Link] = await links_repo.get_by_edition(edition_id) if edition else []
-    unattached_links = await links_repo.list_unattached()
-    agent_runs = await agent_runs_repo.list_by_edition(edition_id)
-    feedback = await feedback_repo.get_by_edition(edition_id)
-    links_by_id = {link.id: link for link in links}
+    # None of these queries depend on each other, so issue them together.
+    (
+        edition,
+        links,
+        unattached_links,
+        agent_runs,
+        feedback,
+        revisions,
+    ) = await asyncio.gather(
+        editions_repo.get(edition_id, edition_id),
+        links_repo.get_by_edition(edition_id),
+        links_repo.list_unattached(),
+        agent_runs_repo.list_by_edition(edition_id),
+        feedback_repo.get_by_edition(edition_id),
+        _list_revisions(edition_id, revisions_repo),
+    )
+    if edition is None:
+        logger.info("Workspace edition not found — edition=%s", edition_id)
+        return {"edition": None}
 
     # Group agent runs by trigger (link) ID, then by invocation.
     # Runs must be in chronological order for grouping (oldest first).
@@ -110,10 +138,13 @@ async def get_workspace_data(
     for run in runs_chronological:
         runs_by_trigger.setdefault(run.trigger_id, []).append(run)
 
-    link_run_groups = {
-        link.id: group_runs_by_invocation(runs_by_trigger.get(link.id, []))
-        for link in links
-    }
+    links_by_id: dict[str, Link] = {}
+    link_run_groups: dict[str, list[list[Any]]] = {}
+    for link in links:
+        links_by_id[link.id] = link
+        link_run_groups[link.id] = group_runs_by_invocation(
+            runs_by_trigger.get(link.id, [])
+        )
 
     # Group agent runs triggered by feedback items
     feedback_run_groups: dict[str, list[list[Any]]] = {}
@@ -124,17 +155,12 @@ async def get_workspace_data(
 
     unresolved_count = sum(1 for fb in feedback if not fb.resolved)
 
-    revisions = []
-    revision_diffs = []
-    if revisions_repo:
-        revisions = await revisions_repo.list_by_edition(edition_id)
-        revision_diffs = compute_diffs(revisions)
+    revision_diffs = compute_diffs(revisions)
 
     logger.info(
-        "Workspace data assembled — edition=%s exists=%s links=%d "
+        "Workspace data assembled — edition=%s links=%d "
         "unattached=%d runs=%d feedback=%d revisions=%d duration_ms=%.0f",
         edition_id,
-        edition is not None,
         len(links),
         len(unattached_links),
         len(agent_runs),
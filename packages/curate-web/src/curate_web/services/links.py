@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from curate_common.models.edition import EditionStatus
@@ -100,21 +101,26 @@ async def delete_link(
     if not link:
         return None
 
-    await links_repo.soft_delete(link, link_id)
-
-    if link.edition_id:
-        edition = await editions_repo.get(link.edition_id, link.edition_id)
-        if edition:
-            if link_id in edition.link_ids:
-                edition.link_ids.remove(link_id)
-                edition.content = {}
-                await editions_repo.update(edition, link.edition_id)
-
-                remaining = await links_repo.get_by_status(
-                    link.edition_id, LinkStatus.DRAFTED
-                )
-                for remaining_link in remaining:
-                    remaining_link.status = LinkStatus.REVIEWED
-                    await links_repo.update(remaining_link, remaining_link.id)
-            return edition
+    if not link.edition_id:
+        await links_repo.soft_delete(link, link_id)
+        return None
+
+    edition_id = link.edition_id
+    _, edition = await asyncio.gather(
+        links_repo.soft_delete(link, link_id),
+        editions_repo.get(edition_id, edition_id),
+    )
+    if edition:
+        if link_id in edition.link_ids:
+            edition.link_ids.remove(link_id)
+            edition.content = {}
+            _, remaining = await asyncio.gather(
+                editions_repo.update(edition, edition_id),
+                links_repo.get_by_status(edition_id, LinkStatus.DRAFTED),
+            )
+            # Links are partitioned by their own ID, so each needs its own write.
+            for remaining_link in remaining:
+                remaining_link.status = LinkStatus.REVIEWED
+            await asyncio.gather(*(links_repo.update(r, r.id) for r in remaining))
+        return edition
     return None
@@ -6,6 +6,7 @@ and the Settings dashboard routes for listing, searching, and clearing memories.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
@@ -112,7 +113,9 @@ class MemoryService:
         try:
             from azure.ai.projects.models import MemorySearchOptions  # noqa: PLC0415
 
-            response = self._client.memory_stores.search_memories(
+            # The project client is synchronous; keep its HTTP call off the loop.
+            response = await asyncio.to_thread(
+                self._client.memory_stores.search_memories,
                 name=self._config.memory_store_name,
                 scope=scope,
                 options=MemorySearchOptions(max_memories=50),
@@ -150,7 +153,8 @@ class MemoryService:
                 ResponsesUserMessageItemParam,
             )
 
-            response = self._client.memory_stores.search_memories(
+            response = await asyncio.to_thread(
+                self._client.memory_stores.search_memories,
                 name=self._config.memory_store_name,
                 scope=scope,
                 items=[ResponsesUserMessageItemParam(content=query)],
@@ -183,7 +187,8 @@ class MemoryService:
             return False
 
         try:
-            self._client.memory_stores.delete_scope(
+            await asyncio.to_thread(
+                self._client.memory_stores.delete_scope,
                 name=self._config.memory_store_name,
                 scope=scope,
             )
@@ -26,12 +26,30 @@ from curate_worker.startup import (
 logger = logging.getLogger(__name__)
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the worker loop: uvloop when available, with eager task start.
+
+    Eager tasks run synchronously until their first suspension, so tasks that
+    finish without blocking skip a round trip through the event loop.
+    """
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    else:
+        loop = uvloop.new_event_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
 async def run() -> None:
     """Initialize and run the worker until terminated."""
     settings = load_settings()
     configure_logging(settings.app.log_level, log_file="worker.log")
 
-    logger.info("Worker starting")
+    logger.info(
+        "Worker starting — event_loop=%s", type(asyncio.get_running_loop()).__module__
+    )
 
     if settings.monitor.connection_string:
         configure_azure_monitor(
@@ -72,6 +90,8 @@ async def run() -> None:
         render_fn=renderer.render_edition,
         upload_fn=storage.upload_html,
         context_providers=context_providers,
+        max_concurrency=settings.app.orchestrator_concurrency,
+        link_fast_path=settings.app.link_fast_path,
     )
     command_consumer = ServiceBusCommandConsumer(
         settings.servicebus,
@@ -92,6 +112,7 @@ async def run() -> None:
     logger.info("Worker shutting down")
     await command_consumer.stop()
     await processor.stop()
+    await processor.orchestrator.close()
     await event_publisher.close()
     await storage.close()
     await cosmos.close()
@@ -100,7 +121,7 @@ async def run() -> None:
 
 def main() -> None:
     """Entry point for the worker process."""
-    asyncio.run(run())
+    asyncio.run(run(), loop_factory=_new_event_loop)
 
 
 if __name__ == "__main__":
@@ -5,12 +5,14 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import OrderedDict
 from datetime import UTC, datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from agent_framework import Agent
 
-from curate_common.models.agent_run import AgentRunStatus
+from curate_common.models.agent_run import AgentRun, AgentRunStatus, AgentStage
 from curate_common.models.link import LinkStatus
 from curate_worker.agents.draft import DraftAgent
 from curate_worker.agents.edit import EditAgent
@@ -23,13 +25,24 @@ from curate_worker.agents.prompts import load_prompt
 from curate_worker.agents.publish import PublishAgent
 from curate_worker.agents.review import ReviewAgent
 from curate_worker.pipeline.rendering import render_link_row
+from curate_worker.pipeline.retry import (
+    is_transient_error,
+    retry_delay,
+    retry_transient,
+)
 from curate_worker.pipeline.runs import RunManager
+from curate_worker.pipeline.scheduling import (
+    FEEDBACK_PRIORITY,
+    LINK_PRIORITY,
+    PUBLISH_PRIORITY,
+    PrioritySemaphore,
+)
 from curate_worker.pipeline.tools import OrchestratorToolsMixin, feedback_ctx
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
-    from agent_framework import BaseChatClient
+    from agent_framework import AgentSession, BaseChatClient
 
     from curate_common.database.repositories.agent_runs import AgentRunRepository
     from curate_common.database.repositories.editions import EditionRepository
@@ -43,7 +56,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 _MAX_STAGE_RETRIES = 3
-_RETRY_BASE_DELAY = 2.0
+_EDITION_LOCK_STRIPES = 64
+_DEFAULT_MAX_CONCURRENCY = 8
+_MAX_HANDLED_VERSIONS = 10_000
+
+# Both middlewares are stateless (per-call data lives on the context), so one
+# pair is shared by every orchestrator instance.
+_MIDDLEWARE = (TokenTrackingMiddleware(), ToolLoggingMiddleware())
 
 
 class PipelineOrchestrator(OrchestratorToolsMixin):
@@ -61,6 +80,9 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
         upload_fn: Callable[[str, str], Awaitable[None]] | None = None,
         context_providers: list | None = None,
         revisions_repo: RevisionRepository | None = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        *,
+        link_fast_path: bool = False,
     ) -> None:
         """Initialize the orchestrator with LLM client and all repositories."""
         self._client = client
@@ -73,8 +95,17 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
         self._runs = RunManager(agent_runs_repo, self._events)
         self._last_stage_usage = None
 
-        self._edition_locks: dict[str, asyncio.Lock] = {}
-        self._edition_locks_guard = asyncio.Lock()
+        self._active_links: set[str] = set()
+        self._handled_versions: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self._link_runs: dict[str, list[AgentRun]] = {}
+        self._background_tasks: set[asyncio.Task] = set()
+        self._pending_link_updates: dict[str, asyncio.Task] = {}
+        self._open_stage_runs: OrderedDict[str, AgentRun] = OrderedDict()
+        self._agent_semaphore = PrioritySemaphore(max_concurrency)
+        self._link_fast_path = link_fast_path
+        self._edition_lock_stripes = tuple(
+            asyncio.Lock() for _ in range(_EDITION_LOCK_STRIPES)
+        )
 
         self.fetch = FetchAgent(client, links_repo)
         self.review = ReviewAgent(client, links_repo)
@@ -99,6 +130,11 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
             upload_fn=upload_fn,
             revisions_repo=revisions_repo,
         )
+        self._fast_path_stages = (
+            (AgentStage.FETCH, self.fetch),
+            (AgentStage.REVIEW, self.review),
+            (AgentStage.DRAFT, self.draft),
+        )
 
         self._agent = Agent(
             client=client,
@@ -120,10 +156,7 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
                 self.record_stage_start,
                 self.record_stage_complete,
             ],
-            middleware=[
-                TokenTrackingMiddleware(),
-                ToolLoggingMiddleware(),
-            ],
+            middleware=list(_MIDDLEWARE),
         )
 
     @property
@@ -131,12 +164,23 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
         """Return the inner Agent framework instance."""
         return self._agent  # ty: ignore[invalid-return-type]
 
-    async def _get_edition_lock(self, edition_id: str) -> asyncio.Lock:
-        """Get or create a per-edition lock for serializing feedback processing."""
-        async with self._edition_locks_guard:
-            if edition_id not in self._edition_locks:
-                self._edition_locks[edition_id] = asyncio.Lock()
-            return self._edition_locks[edition_id]
+    async def close(self) -> None:
+        """Flush pending events before the event publisher is closed."""
+        await asyncio.gather(
+            *self._pending_link_updates.values(),
+            *self._background_tasks,
+            return_exceptions=True,
+        )
+        await self._runs.close()
+
+    def _get_edition_lock(self, edition_id: str) -> asyncio.Lock:
+        """Return the lock stripe that serializes feedback for an edition.
+
+        A fixed pool keeps memory bounded however many editions are seen; two
+        editions sharing a stripe are merely serialized, never interleaved.
+        """
+        stripes = self._edition_lock_stripes
+        return stripes[hash(edition_id) % len(stripes)]
 
     async def _claim_link(self, link_id: str, status: str) -> Link | None:
         """Attempt to durably claim a submitted link for processing."""
@@ -148,11 +192,68 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
             )
             return None
 
-        link = await self._links_repo.claim_submitted(link_id)
+        # Duplicate change events for a link already in flight on this worker
+        # are dropped without a Cosmos round trip; the check-and-add has no
+        # await in between, so it needs no lock.  The durable claim below
+        # still arbitrates between workers.
+        if link_id in self._active_links:
+            logger.debug("Link %s already processing, skipping", link_id)
+            return None
+        self._active_links.add(link_id)
+
+        try:
+            link = await self._links_repo.claim_submitted(link_id)
+        except BaseException:
+            # A failed claim must not leave the link marked in flight, or
+            # every redelivery of it would be skipped for good.
+            self._active_links.discard(link_id)
+            raise
         if link is None:
+            self._active_links.discard(link_id)
             logger.debug("Link %s claim rejected, skipping", link_id)
         return link
 
+    async def _invoke_agent(
+        self,
+        run: AgentRun,
+        message: str,
+        session: AgentSession | None = None,
+        *,
+        priority: int = LINK_PRIORITY,
+    ) -> None:
+        """Run the orchestrator agent and record its response on ``run``.
+
+        Calls are bounded by a semaphore so a burst of change-feed events
+        cannot oversubscribe the LLM endpoint; sub-agent calls happen inside
+        the orchestrator run, so they are bounded too.  Editor-initiated
+        work passes a more urgent ``priority`` so it is not queued behind a
+        backlog of link processing.
+        """
+        async with self._agent_semaphore.acquire(priority):
+            response = await self._agent.run(message, session=session)
+        run.status = AgentRunStatus.COMPLETED
+        run.output = {"content": response.text if response else None}
+        run.usage = RunManager.normalize_usage(
+            response.usage_details if response else None
+        )
+
+    async def _finish_run(self, run: AgentRun, subject: str, t0: float) -> None:
+        """Persist and announce a finished orchestrator run."""
+        run.completed_at = datetime.now(UTC)
+        # The event is built from the in-memory run, so it need not wait on
+        # the Cosmos write.
+        await asyncio.gather(
+            self._agent_runs_repo.update(run, run.edition_id),
+            self._runs.publish_run_event(run),
+        )
+        elapsed_ms = (time.monotonic() - t0) * 1000
+        logger.info(
+            "Orchestrator completed %s duration_ms=%.0f pipeline_run_id=%s",
+            subject,
+            elapsed_ms,
+            run.id,
+        )
+
     async def handle_link_change(self, document: dict[str, Any]) -> None:
         """Process a link document change by invoking the orchestrator agent."""
         link_id = document.get("id", "")
@@ -162,100 +263,237 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
         if not edition_id:
             return
 
+        # A change-feed batch is re-read after a transient poll error; a
+        # document version already handled here can be dropped without
+        # another claim round trip.
+        version = self._document_version(document)
+        if version in self._handled_versions:
+            logger.debug("Link %s version already handled, skipping", link_id)
+            return
+
         link = await self._claim_link(link_id, status)
-        if link is None:
+        if link is not None:
+            try:
+                await self._process_link(link, edition_id, status)
+            finally:
+                self._active_links.discard(link_id)
+                self._link_runs.pop(link_id, None)
+        self._remember_version(version)
+
+    @staticmethod
+    def _document_version(document: dict[str, Any]) -> tuple[str, str] | None:
+        """Identify a change-feed document version by its id and etag."""
+        etag = document.get("_etag")
+        return (document.get("id", ""), etag) if isinstance(etag, str) else None
+
+    def _remember_version(self, version: tuple[str, str] | None) -> None:
+        """Remember a handled document version for replay deduplication."""
+        if version is None:
             return
+        self._handled_versions[version] = None
+        if len(self._handled_versions) > _MAX_HANDLED_VERSIONS:
+            self._handled_versions.popitem(last=False)
 
+    async def _process_link(self, link: Link, edition_id: str, status: str) -> None:
+        """Drive a claimed link through the pipeline and record the run."""
+        link_id = link.id
         logger.info("Orchestrator processing link=%s status=%s", link_id, status)
+        # While the link is in flight its runs are tracked in memory, so
+        # link-row refreshes after each stage need no get_by_trigger query.
         run = await self._runs.create_orchestrator_run(
             edition_id, link_id, {"status": status}
         )
-        pipeline_run_id = run.id
+        try:
+            prior_runs = await self._agent_runs_repo.get_by_trigger(link_id)
+        except Exception:
+            # The run is already RUNNING, so carry on with partial history
+            # rather than leave it orphaned.
+            logger.exception("Failed to load run history for link=%s", link_id)
+            prior_runs = []
+        # The history query may already include the new run; keep one copy.
+        self._link_runs[link_id] = [
+            *(prior for prior in prior_runs if prior.id != run.id),
+            run,
+        ]
         t0 = time.monotonic()
+        if self._link_fast_path:
+            await self._run_link_stages(run, link, edition_id)
+        else:
+            await self._route_link(run, link, edition_id, status)
+
+        # The stalled-link check does not feed back into this handler, so it
+        # runs in the background and overlaps the run write below.  It renders
+        # from the in-memory runs, which already hold every outcome, rather
+        # than reading back writes that may still be in flight.
+        task = asyncio.create_task(
+            self._fail_if_stalled(link_id, status, self._link_runs[link_id])
+        )
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+        await self._finish_run(run, f"link={link_id}", t0)
+
+    async def _route_link(
+        self, run: AgentRun, link: Link, edition_id: str, status: str
+    ) -> None:
+        """Let the orchestrator agent route a link through the pipeline stages."""
+        link_id = link.id
+        message = (
+            f"A link needs processing through the pipeline.\n"
+            f"Link ID: {link_id}\n"
+            f"Edition ID: {edition_id}\n"
+            f"URL: {link.url}\n"
+            f"Current status: {status}"
+        )
         last_error: Exception | None = None
+        attempt = 0
         for attempt in range(1, _MAX_STAGE_RETRIES + 1):
             try:
-                message = (
-                    f"A link needs processing through the pipeline.\n"
-                    f"Link ID: {link_id}\n"
-                    f"Edition ID: {edition_id}\n"
-                    f"URL: {link.url}\n"
-                    f"Current status: {status}"
-                )
-                response = await self._agent.run(message)
-                run.status = AgentRunStatus.COMPLETED
-                run.output = {"content": response.text if response else None}
-                run.usage = RunManager.normalize_usage(
-                    dict(response.usage_details)
-                    if response and response.usage_details
-                    else None
-                )
+                await self._invoke_agent(run, message)
                 last_error = None
                 break
             except Exception as exc:  # noqa: BLE001
                 last_error = exc
-                if attempt < _MAX_STAGE_RETRIES:
-                    delay = _RETRY_BASE_DELAY * (2 ** (attempt - 1))
-                    logger.warning(
-                        "Orchestrator attempt %d/%d failed for link %s, "
-                        "retrying in %.1fs — pipeline_run_id=%s: %s",
-                        attempt,
-                        _MAX_STAGE_RETRIES,
-                        link_id,
-                        delay,
-                        pipeline_run_id,
-                        exc,
-                    )
-                    await asyncio.sleep(delay)
+                # Sub-agent tools retry their own transient failures, so only
+                # transient errors from the orchestrator's LLM call land here
+                # worth retrying; logical failures would just repeat.
+                if attempt >= _MAX_STAGE_RETRIES or not is_transient_error(exc):
+                    break
+                delay = retry_delay(attempt)
+                logger.warning(
+                    "Orchestrator attempt %d/%d failed for link %s, "
+                    "retrying in %.1fs — pipeline_run_id=%s: %s",
+                    attempt,
+                    _MAX_STAGE_RETRIES,
+                    link_id,
+                    delay,
+                    run.id,
+                    exc,
+                )
+                await asyncio.sleep(delay)
 
         if last_error is not None:
             logger.exception(
                 "Orchestrator failed for link %s after %d attempts"
                 " — pipeline_run_id=%s",
                 link_id,
-                _MAX_STAGE_RETRIES,
-                pipeline_run_id,
+                attempt,
+                run.id,
                 exc_info=last_error,
             )
             run.status = AgentRunStatus.FAILED
-            run.output = {
-                "error": (f"Orchestrator failed after {_MAX_STAGE_RETRIES} attempts"),
-            }
+            run.output = {"error": f"Orchestrator failed after {attempt} attempts"}
 
-        run.completed_at = datetime.now(UTC)
-        await self._agent_runs_repo.update(run, edition_id)
-        await self._runs.publish_run_event(run)
-        elapsed_ms = (time.monotonic() - t0) * 1000
-        logger.info(
-            "Orchestrator completed link=%s duration_ms=%.0f pipeline_run_id=%s",
-            link_id,
-            elapsed_ms,
-            pipeline_run_id,
-        )
-
-        updated_link = await self._links_repo.get(link_id, link_id)
-        if updated_link and updated_link.status == status:
+    async def _run_link_stages(
+        self, run: AgentRun, link: Link, edition_id: str
+    ) -> None:
+        """Run fetch, review and draft directly, without LLM routing between them.
+
+        Mirrors the orchestrator prompt: each stage is recorded as its own run
+        and the pipeline stops at the first failed stage or failed link.
+        """
+        completed: list[str] = []
+        for stage, agent in self._fast_path_stages:
+            stage_run = await self._start_stage(stage, link.id, edition_id)
+            try:
+                result = await retry_transient(
+                    stage, partial(self._run_stage_agent, agent, link)
+                )
+            except Exception as exc:
+                logger.exception(
+                    "Link %s stage failed for link %s — pipeline_run_id=%s",
+                    stage,
+                    link.id,
+                    run.id,
+                )
+                await self._finish_stage(
+                    stage_run, link.id, failed=True, error=str(exc)
+                )
+                run.status = AgentRunStatus.FAILED
+                run.output = {"error": f"{stage} stage failed"}
+                return
+            await self._finish_stage(
+                stage_run,
+                link.id,
+                failed=False,
+                usage=RunManager.normalize_usage(result["usage"]),
+            )
+            completed.append(stage)
+            try:
+                current = await self._links_repo.get(link.id, link.id)
+            except Exception:
+                logger.exception(
+                    "Link status check failed after %s for link %s"
+                    " — pipeline_run_id=%s",
+                    stage,
+                    link.id,
+                    run.id,
+                )
+                run.status = AgentRunStatus.FAILED
+                run.output = {"error": f"Link status check failed after {stage}"}
+                return
+            if current is None or current.status == LinkStatus.FAILED:
+                break
+        run.status = AgentRunStatus.COMPLETED
+        run.output = {"content": f"Ran stages: {', '.join(completed)}"}
+
+    async def _run_stage_agent(
+        self, agent: FetchAgent | ReviewAgent | DraftAgent, link: Link
+    ) -> dict:
+        """Run one fast-path stage attempt while holding an agent slot.
+
+        The slot is taken per attempt so retry backoff does not hold it
+        away from feedback and publish work.
+        """
+        async with self._agent_semaphore.acquire(LINK_PRIORITY):
+            return await agent.run(link)
+
+    async def _fail_if_stalled(
+        self, link_id: str, status: str, runs: list[AgentRun]
+    ) -> None:
+        """Mark a link failed if the orchestrator left it in its event status."""
+        try:
+            updated_link = await self._links_repo.get(link_id, link_id)
+            if updated_link is None or updated_link.status != status:
+                return
             updated_link.status = LinkStatus.FAILED
             await self._links_repo.update(updated_link, link_id)
-            runs = await self._agent_runs_repo.get_by_trigger(link_id)
             await self._events.publish(
                 "link-update",
                 render_link_row(updated_link, runs),
             )
+        except Exception:
+            logger.exception("Failed to check stalled link %s", link_id)
 
     async def handle_feedback_change(self, document: dict[str, Any]) -> None:
         """Process new feedback by invoking the orchestrator agent."""
+        if document.get("resolved", False):
+            return
+
         edition_id = document.get("edition_id", "")
         feedback_id = document.get("id", "")
+        if not edition_id or not feedback_id:
+            return
+
         learn_from_feedback = document.get("learn_from_feedback", True)
         section = document.get("section", "")
         comment = document.get("comment", "")
+        message = (
+            f"Editor feedback has been submitted and needs processing.\n"
+            f"Edition ID: {edition_id}\n"
+            f"Feedback ID: {feedback_id}\n"
+            f"Section: {section}\n"
+            f"Feedback: {comment}\n"
+            f"Run the edit stage to address the feedback."
+        )
 
-        if document.get("resolved", False):
-            return
-
-        edition_lock = await self._get_edition_lock(edition_id)
-        async with edition_lock:
+        version = self._document_version(document)
+        async with self._get_edition_lock(edition_id):
+            # Replays of feedback already edited here would re-run the LLM;
+            # duplicates queued on the lock are dropped once it is released.
+            if version in self._handled_versions:
+                logger.debug("Feedback %s version already handled", feedback_id)
+                return
             logger.info(
                 "Orchestrator processing feedback=%s edition=%s",
                 feedback_id,
@@ -264,7 +502,6 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
             run = await self._runs.create_orchestrator_run(
                 edition_id, feedback_id, {"edition_id": edition_id}
             )
-            pipeline_run_id = run.id
             t0 = time.monotonic()
 
             # Bridge feedback metadata to _edit_tool via contextvar
@@ -276,87 +513,50 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
                 }
             )
             try:
-                message = (
-                    f"Editor feedback has been submitted and needs processing.\n"
-                    f"Edition ID: {edition_id}\n"
-                    f"Feedback ID: {feedback_id}\n"
-                    f"Section: {section}\n"
-                    f"Feedback: {comment}\n"
-                    f"Run the edit stage to address the feedback."
-                )
                 # When "Learn from this feedback" is unchecked, skip memory capture
                 session = self._agent.create_session()
                 if not learn_from_feedback:
                     session.state["skip_memory_capture"] = True
-                response = await self._agent.run(message, session=session)
-                run.status = AgentRunStatus.COMPLETED
-                run.output = {"content": response.text if response else None}
-                run.usage = RunManager.normalize_usage(
-                    dict(response.usage_details)
-                    if response and response.usage_details
-                    else None
+                await self._invoke_agent(
+                    run, message, session, priority=FEEDBACK_PRIORITY
                 )
             except Exception:
                 logger.exception(
                     "Orchestrator failed for feedback %s — pipeline_run_id=%s",
                     feedback_id,
-                    pipeline_run_id,
+                    run.id,
                 )
                 run.status = AgentRunStatus.FAILED
                 run.output = {"error": "Orchestrator failed"}
+            else:
+                # Only a successful edit is remembered, so a replay retries
+                # a failed one.
+                self._remember_version(version)
             finally:
                 feedback_ctx.reset(ctx_token)
-                run.completed_at = datetime.now(UTC)
-                await self._agent_runs_repo.update(run, edition_id)
-                await self._runs.publish_run_event(run)
-                elapsed_ms = (time.monotonic() - t0) * 1000
-                logger.info(
-                    "Orchestrator completed feedback=%s duration_ms=%.0f"
-                    " pipeline_run_id=%s",
-                    feedback_id,
-                    elapsed_ms,
-                    pipeline_run_id,
-                )
+                await self._finish_run(run, f"feedback={feedback_id}", t0)
 
     async def handle_publish(self, edition_id: str) -> None:
         """Process a publish approval by invoking the orchestrator agent."""
         logger.info("Orchestrator processing publish for edition=%s", edition_id)
+        message = (
+            f"The editor has approved this edition for publishing.\n"
+            f"Edition ID: {edition_id}\n"
+            f"Run the publish stage to render and upload it."
+        )
         run = await self._runs.create_orchestrator_run(
             edition_id, edition_id, {"edition_id": edition_id}
         )
-        pipeline_run_id = run.id
         t0 = time.monotonic()
         try:
-            message = (
-                f"The editor has approved this edition for publishing.\n"
-                f"Edition ID: {edition_id}\n"
-                f"Run the publish stage to render and upload it."
-            )
-            response = await self._agent.run(message)
-            run.status = AgentRunStatus.COMPLETED
-            run.output = {"content": response.text if response else None}
-            run.usage = RunManager.normalize_usage(
-                dict(response.usage_details)
-                if response and response.usage_details
-                else None
-            )
+            await self._invoke_agent(run, message, priority=PUBLISH_PRIORITY)
         except Exception:
             logger.exception(
                 "Orchestrator failed for publish edition=%s — pipeline_run_id=%s",
                 edition_id,
-                pipeline_run_id,
+                run.id,
             )
             run.status = AgentRunStatus.FAILED
             run.output = {"error": "Orchestrator failed"}
         finally:
-            run.completed_at = datetime.now(UTC)
-            await self._agent_runs_repo.update(run, edition_id)
-            await self._runs.publish_run_event(run)
-            elapsed_ms = (time.monotonic() - t0) * 1000
-            logger.info(
-                "Orchestrator completed publish edition=%s duration_ms=%.0f"
-                " pipeline_run_id=%s",
-                edition_id,
-                elapsed_ms,
-                pipeline_run_id,
-            )
+            await self._finish_run(run, f"publish edition={edition_id}", t0)
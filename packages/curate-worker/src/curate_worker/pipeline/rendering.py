@@ -2,53 +2,98 @@
 
 from __future__ import annotations
 
-from html import escape
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from curate_common.models.link import Link
 
 _DISPLAY_URL_MAX_LENGTH = 50
 
+# Same replacements as html.escape(quote=True), applied in a single pass.
+_HTML_ESCAPES = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
 
-def render_link_row(link: Link, runs: list) -> str:
-    """Render an HTML table row for a link (used in SSE updates)."""
-    url = escape(link.url)
+
+def escape(value: str) -> str:
+    """Escape HTML special characters, matching ``html.escape``."""
+    return value.translate(_HTML_ESCAPES)
+
+
+@lru_cache(maxsize=512)
+def _render_progress(run_status: str, run_stage: str, count: int) -> str:
+    """Render the agent progress cell; inputs come from small enums and counts."""
+    run_status = escape(run_status)
+    run_stage = escape(run_stage)
+    suffix = "s" if count != 1 else ""
+    return (
+        f'<span class="agent-indicator">'
+        f'<span class="agent-indicator-dot'
+        f' agent-indicator-dot-{run_status}"></span>'
+        f'<span class="stage-{run_stage}">{run_stage}</span>'
+        f"</span> ({count} run{suffix})"
+    )
+
+
+_NO_PROGRESS = (
+    '<span class="agent-indicator" style="color: var(--text-muted);">—</span>'
+)
+
+_ROW_HEAD_TEMPLATE = (
+    '<tr id="link-{id}" hx-swap-oob="true">'
+    '<td><a href="{url}" target="_blank"'
+    ' style="color: var(--accent);">'
+    "{display_url}</a></td>"
+    "<td>{title}</td>"
+    '<td><span class="badge badge-{status}">{status}</span></td>'
+    "<td>"
+)
+_ROW_TAIL_TEMPLATE = '</td><td style="color: var(--text-muted);">{created}</td></tr>'
+
+
+@lru_cache(maxsize=1024)
+def _render_link_cells(
+    link_id: str,
+    url: str,
+    title: str | None,
+    status: str,
+    created_at: datetime | None,
+) -> tuple[str, str]:
+    """Render the link-owned HTML around the progress cell.
+
+    A link's row is re-rendered on every stage completion while only its
+    runs change, so the escaped link fields are keyed by their values.
+    """
+    escaped_url = escape(url)
     display_url = (
-        (escape(link.url[:47]) + "...")
-        if len(link.url) > _DISPLAY_URL_MAX_LENGTH
-        else url
+        (escape(url[:47]) + "...")
+        if len(url) > _DISPLAY_URL_MAX_LENGTH
+        else escaped_url
     )
-    title = escape(link.title) if link.title else "—"
-    status = escape(link.status)
-    created = link.created_at.strftime("%Y-%m-%d %H:%M") if link.created_at else "—"
+    head = _ROW_HEAD_TEMPLATE.format_map(
+        {
+            "id": escape(link_id),
+            "url": escaped_url,
+            "display_url": display_url,
+            "title": escape(title) if title else "—",
+            "status": escape(status),
+        }
+    )
+    created = created_at.strftime("%Y-%m-%d %H:%M") if created_at else "—"
+    return head, _ROW_TAIL_TEMPLATE.format(created=created)
+
 
+def render_link_row(link: Link, runs: list) -> str:
+    """Render an HTML table row for a link (used in SSE updates)."""
+    head, tail = _render_link_cells(
+        link.id, link.url, link.title, link.status, link.created_at
+    )
     if runs:
         latest = runs[-1] if runs[-1].started_at else runs[0]
-        run_status = escape(latest.status)
-        run_stage = escape(latest.stage)
-        count = len(runs)
-        suffix = "s" if count != 1 else ""
-        progress = (
-            f'<span class="agent-indicator">'
-            f'<span class="agent-indicator-dot'
-            f' agent-indicator-dot-{run_status}"></span>'
-            f'<span class="stage-{run_stage}">{run_stage}</span>'
-            f"</span> ({count} run{suffix})"
-        )
+        progress = _render_progress(latest.status, latest.stage, len(runs))
     else:
-        progress = (
-            '<span class="agent-indicator" style="color: var(--text-muted);">—</span>'
-        )
-
-    return (
-        f'<tr id="link-{escape(link.id)}" hx-swap-oob="true">'
-        f'<td><a href="{url}" target="_blank"'
-        f' style="color: var(--accent);">'
-        f"{display_url}</a></td>"
-        f"<td>{title}</td>"
-        f'<td><span class="badge badge-{status}">{status}</span></td>'
-        f"<td>{progress}</td>"
-        f'<td style="color: var(--text-muted);">{created}</td>'
-        f"</tr>"
-    )
+        progress = _NO_PROGRESS
+    return head + progress + tail
@@ -0,0 +1,73 @@
+"""Transient-failure detection and retry helpers for pipeline LLM calls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+_TRANSIENT_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+_MAX_CAUSE_DEPTH = 5
+
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 30.0
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Return True when an exception (or its cause chain) is worth retrying.
+
+    Chat clients wrap provider errors (rate limits, timeouts, 5xx) in their
+    own exception types, so the ``__cause__`` chain is inspected as well.
+    """
+    current: BaseException | None = exc
+    for _ in range(_MAX_CAUSE_DEPTH):
+        if current is None:
+            break
+        if isinstance(current, (TimeoutError, ConnectionError, httpx.TransportError)):
+            return True
+        status_code = getattr(current, "status_code", None)
+        if isinstance(status_code, int):
+            return status_code in _TRANSIENT_STATUS_CODES
+        current = current.__cause__
+    return False
+
+
+def retry_delay(attempt: int) -> float:
+    """Return the capped, jittered backoff delay before retry ``attempt`` + 1.
+
+    Jitter of ±50% keeps links that failed together during an outage from
+    retrying in lockstep.
+    """
+    base_delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** (attempt - 1)))
+    # Backoff spread only; no security property needed.
+    return base_delay * random.uniform(0.5, 1.5)  # noqa: S311
+
+
+async def retry_transient[T](name: str, call: Callable[[], Awaitable[T]]) -> T:
+    """Await ``call``, retrying transient failures with exponential backoff."""
+    for attempt in range(1, MAX_ATTEMPTS):
+        try:
+            return await call()
+        except Exception as exc:
+            if not is_transient_error(exc):
+                raise
+            delay = retry_delay(attempt)
+            logger.warning(
+                "Transient failure in %s (attempt %d/%d), retrying in %.1fs: %s",
+                name,
+                attempt,
+                MAX_ATTEMPTS,
+                delay,
+                exc,
+            )
+            await asyncio.sleep(delay)
+    return await call()
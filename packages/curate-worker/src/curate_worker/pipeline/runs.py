@@ -2,15 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import contextvars
+import logging
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from curate_common.models.agent_run import AgentRun, AgentStage
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping
+
     from curate_common.database.repositories.agent_runs import AgentRunRepository
     from curate_common.events import EventPublisher
 
+logger = logging.getLogger(__name__)
+_EVENT_QUEUE_MAXSIZE = 1024
+
+# A queued run write (or None for event-only entries), then its SSE event.
+type _PendingOp = tuple[Callable[[], Awaitable[object]] | None, str, dict[str, Any]]
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def start_event_payload(run: AgentRun) -> dict[str, Any]:
+    """Build the ``agent-run-start`` SSE payload for a run."""
+    return {
+        "id": run.id,
+        "stage": run.stage,
+        "trigger_id": run.trigger_id,
+        "edition_id": run.edition_id,
+        "status": run.status,
+        "started_at": _isoformat(run.started_at),
+    }
+
+
+def complete_event_payload(run: AgentRun) -> dict[str, Any]:
+    """Build the ``agent-run-complete`` SSE payload for a run."""
+    return {
+        "id": run.id,
+        "stage": run.stage,
+        "trigger_id": run.trigger_id,
+        "edition_id": run.edition_id,
+        "status": run.status,
+        "output": run.output,
+        "usage": run.usage,
+        "started_at": _isoformat(run.started_at),
+        "completed_at": _isoformat(run.completed_at),
+    }
+
 
 class RunManager:
     """Encapsulates creation and event-publishing for AgentRun records."""
@@ -23,11 +67,19 @@ class RunManager:
         """Initialize with repository and event publisher."""
         self._agent_runs_repo = agent_runs_repo
         self._events = events
+        self._pending_events: asyncio.Queue[_PendingOp] = asyncio.Queue(
+            maxsize=_EVENT_QUEUE_MAXSIZE
+        )
+        self._drain_task: asyncio.Task | None = None
 
     async def create_orchestrator_run(
         self, edition_id: str, trigger_id: str, input_data: dict
     ) -> AgentRun:
-        """Create an agent run record for the orchestrator itself."""
+        """Create an agent run record for the orchestrator itself.
+
+        The record is written before returning; its start event is queued
+        behind earlier run events rather than awaited on the event bus.
+        """
         run = AgentRun(
             stage=AgentStage.ORCHESTRATOR,
             edition_id=edition_id,
@@ -36,47 +88,100 @@ class RunManager:
             started_at=datetime.now(UTC),
         )
         await self._agent_runs_repo.create(run)
-        await self._events.publish(
-            "agent-run-start",
-            {
-                "id": run.id,
-                "stage": run.stage,
-                "trigger_id": run.trigger_id,
-                "edition_id": run.edition_id,
-                "status": run.status,
-                "started_at": (run.started_at.isoformat() if run.started_at else None),
-            },
-        )
+        await self._enqueue(None, "agent-run-start", start_event_payload(run))
         return run
 
-    async def publish_run_event(self, run: AgentRun) -> None:
-        """Publish an SSE event when a run completes or fails."""
-        await self._events.publish(
+    async def create_stage_run(self, run: AgentRun) -> None:
+        """Create a stage run record and queue its start event.
+
+        The create is awaited so a failed write reaches the caller instead of
+        leaving later updates aimed at a missing document.
+        """
+        await self._agent_runs_repo.create(run.model_copy())
+        await self._enqueue(None, "agent-run-start", start_event_payload(run))
+
+    async def complete_stage_run(self, run: AgentRun) -> None:
+        """Queue the Cosmos update and complete event for a stage run.
+
+        The update is written behind the pipeline; its create has already
+        landed, and queued entries drain in order.
+        """
+        await self._enqueue(
+            partial(self._agent_runs_repo.update, run.model_copy(), run.edition_id),
             "agent-run-complete",
-            {
-                "id": run.id,
-                "stage": run.stage,
-                "trigger_id": run.trigger_id,
-                "status": run.status,
-                "output": run.output,
-                "usage": run.usage,
-                "started_at": (run.started_at.isoformat() if run.started_at else None),
-                "completed_at": (
-                    run.completed_at.isoformat() if run.completed_at else None
-                ),
-            },
+            complete_event_payload(run),
         )
 
+    async def publish_run_event(self, run: AgentRun) -> None:
+        """Queue the SSE event for a completed or failed run.
+
+        A background task drains the queue so a slow event bus does not stall
+        the handlers; only a full queue makes the caller wait.
+        """
+        await self._enqueue(None, "agent-run-complete", complete_event_payload(run))
+
+    async def _enqueue(
+        self,
+        write: Callable[[], Awaitable[object]] | None,
+        event_type: str,
+        payload: dict[str, Any],
+    ) -> None:
+        """Append a write/event pair to the ordered drain queue."""
+        if self._drain_task is None or self._drain_task.done():
+            # The drain outlives whichever handler enqueues first, so it must
+            # not inherit that handler's trace span or feedback context.
+            self._drain_task = asyncio.create_task(
+                self._drain_events(), context=contextvars.Context()
+            )
+        item = (write, event_type, payload)
+        try:
+            self._pending_events.put_nowait(item)
+        except asyncio.QueueFull:
+            await self._pending_events.put(item)
+
+    async def _drain_events(self) -> None:
+        """Apply queued run writes and publish their events in order."""
+        while True:
+            write, event_type, payload = await self._pending_events.get()
+            try:
+                if write is not None:
+                    await write()
+                await self._events.publish(event_type, payload)
+            except Exception:
+                logger.exception(
+                    "Failed to record %s for run id=%s", event_type, payload["id"]
+                )
+            finally:
+                self._pending_events.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued run write and event has been handled."""
+        await self._pending_events.join()
+
+    async def close(self) -> None:
+        """Flush queued run events and stop the drain task."""
+        if self._drain_task is None:
+            return
+        if not self._drain_task.done():
+            await self._pending_events.join()
+        self._drain_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._drain_task
+        self._drain_task = None
+
     @staticmethod
-    def normalize_usage(usage: dict | None) -> dict | None:
-        """Normalize framework usage_details to a consistent schema."""
+    def normalize_usage(usage: Mapping[str, Any] | None) -> dict | None:
+        """Normalize framework usage_details to a consistent schema.
+
+        Only reads from ``usage``, so callers pass ``usage_details`` as-is.
+        """
         if not usage:
             return None
-        input_tokens = usage.get("input_token_count", 0) or 0
-        output_tokens = usage.get("output_token_count", 0) or 0
+        input_tokens = usage.get("input_token_count") or 0
+        output_tokens = usage.get("output_token_count") or 0
         return {
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
-            "total_tokens": usage.get("total_token_count", 0)
+            "total_tokens": usage.get("total_token_count")
             or input_tokens + output_tokens,
         }
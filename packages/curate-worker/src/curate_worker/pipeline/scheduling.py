@@ -0,0 +1,65 @@
+"""Priority-aware concurrency limiting for orchestrator agent calls."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+# Lower values are admitted first when agent slots are contended.
+PUBLISH_PRIORITY = 0
+FEEDBACK_PRIORITY = 1
+LINK_PRIORITY = 2
+
+
+class PrioritySemaphore:
+    """A semaphore that hands freed slots to the most urgent waiter.
+
+    Waiters with equal priority are admitted in arrival order, so a steady
+    stream of link events cannot starve each other, while an editor's
+    publish or feedback request jumps ahead of queued link processing.
+    """
+
+    def __init__(self, value: int) -> None:
+        """Initialize with ``value`` concurrent slots."""
+        self._value = value
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    def locked(self) -> bool:
+        """Return True when no slot is free."""
+        return self._value == 0
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, priority: int = LINK_PRIORITY) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the ``async with`` block."""
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._counter), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                # The slot was handed over just as we were cancelled; pass it on.
+                if future.done() and not future.cancelled():
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """Hand the slot to the next live waiter, or return it to the pool."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextvars
 import json
+import logging
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Annotated, Any
 
@@ -11,9 +13,12 @@ from agent_framework import tool
 
 from curate_common.models.agent_run import AgentRun, AgentRunStatus, AgentStage
 from curate_worker.pipeline.rendering import render_link_row
+from curate_worker.pipeline.retry import retry_transient
 from curate_worker.pipeline.runs import RunManager
 
 if TYPE_CHECKING:
+    from collections import OrderedDict
+
     from curate_common.database.repositories.agent_runs import AgentRunRepository
     from curate_common.database.repositories.editions import EditionRepository
     from curate_common.database.repositories.links import LinkRepository
@@ -24,6 +29,22 @@ if TYPE_CHECKING:
     from curate_worker.agents.publish import PublishAgent
     from curate_worker.agents.review import ReviewAgent
 
+logger = logging.getLogger(__name__)
+
+# Stage completions for one link often land in quick succession; waiting this
+# long before re-rendering collapses a burst into a single link-row event.
+_LINK_UPDATE_DEBOUNCE_SECONDS = 0.3
+
+# Runs started through the record_stage_start tool are kept until the
+# matching record_stage_complete; past this many the cache is reset and
+# completions fall back to reading the run from Cosmos.
+_MAX_OPEN_STAGE_RUNS = 1024
+
+# Constant tool replies, serialized once at import.
+_LINK_NOT_FOUND = json.dumps({"error": "Link not found"})
+_EDITION_NOT_FOUND = json.dumps({"error": "Edition not found"})
+_RUN_NOT_FOUND = json.dumps({"error": "Run not found"})
+
 # Carries feedback metadata from handle_feedback_change to _edit_tool so the
 # memory provider on the edit agent can access the skip flag and original
 # feedback content.  ContextVar is per-asyncio-task, so concurrent edition
@@ -40,7 +61,12 @@ class OrchestratorToolsMixin:
     _editions_repo: EditionRepository
     _agent_runs_repo: AgentRunRepository
     _events: EventPublisher
+    _runs: RunManager
     _last_stage_usage: dict | None
+    _pending_link_updates: dict[str, asyncio.Task]
+    _background_tasks: set[asyncio.Task]
+    _open_stage_runs: OrderedDict[str, AgentRun]
+    _link_runs: dict[str, list[AgentRun]]
 
     fetch: FetchAgent
     review: ReviewAgent
@@ -51,19 +77,93 @@ class OrchestratorToolsMixin:
     def _capture_usage(self, response: object) -> str:
         """Extract token usage from a sub-agent response and return its text."""
         usage_details = getattr(response, "usage_details", None) if response else None
-        self._last_stage_usage = RunManager.normalize_usage(
-            dict(usage_details) if usage_details else None
-        )
+        self._last_stage_usage = RunManager.normalize_usage(usage_details)
         text = getattr(response, "text", None)
         return text or ""
 
+    async def _start_stage(
+        self, stage: str, trigger_id: str, edition_id: str
+    ) -> AgentRun:
+        """Create and announce a running AgentRun for a pipeline stage."""
+        run = AgentRun(
+            stage=AgentStage(stage),
+            edition_id=edition_id,
+            trigger_id=trigger_id,
+            input={"stage": stage},
+            started_at=datetime.now(UTC),
+        )
+        await self._runs.create_stage_run(run)
+        link_runs = self._link_runs.get(trigger_id)
+        if link_runs is not None:
+            link_runs.append(run)
+        return run
+
+    async def _finish_stage(
+        self,
+        run: AgentRun,
+        trigger_id: str,
+        *,
+        failed: bool,
+        error: str = "",
+        usage: dict | None = None,
+    ) -> None:
+        """Persist a finished stage run and schedule a link-row refresh."""
+        self._open_stage_runs.pop(run.id, None)
+        run.status = AgentRunStatus.FAILED if failed else AgentRunStatus.COMPLETED
+        run.completed_at = datetime.now(UTC)
+        if error:
+            run.output = {"error": error}
+        if usage:
+            run.usage = usage
+        await self._runs.complete_stage_run(run)
+        self._schedule_link_update(trigger_id)
+
+    def _schedule_link_update(self, link_id: str) -> None:
+        """Debounce link-row refreshes so a burst of completions renders once."""
+        pending = self._pending_link_updates.get(link_id)
+        if pending is not None:
+            pending.cancel()
+        self._pending_link_updates[link_id] = asyncio.create_task(
+            self._publish_link_update(link_id)
+        )
+
+    async def _publish_link_update(self, link_id: str) -> None:
+        """Render and publish the latest link row once the debounce elapses."""
+        await asyncio.sleep(_LINK_UPDATE_DEBOUNCE_SECONDS)
+        # Past the debounce this refresh is committed; a newer schedule must
+        # not cancel it mid-publish.  It moves to the background set so it
+        # stays referenced and close() still waits for it.
+        task = asyncio.current_task()
+        if task is not None and self._pending_link_updates.get(link_id) is task:
+            del self._pending_link_updates[link_id]
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+        try:
+            link, runs = await asyncio.gather(
+                self._links_repo.get(link_id, link_id),
+                self._link_run_history(link_id),
+            )
+            if link:
+                await self._events.publish("link-update", render_link_row(link, runs))
+        except Exception:
+            logger.exception("Failed to publish link row for link=%s", link_id)
+
+    async def _link_run_history(self, link_id: str) -> list[AgentRun]:
+        """Return a link's runs, from memory while the link is in flight."""
+        runs = self._link_runs.get(link_id)
+        if runs is not None:
+            return runs
+        # Render from persisted state: let queued run writes land first.
+        await self._runs.flush()
+        return await self._agent_runs_repo.get_by_trigger(link_id)
+
     @tool(name="fetch")
     async def _fetch_tool(
         self,
         task: Annotated[str, "Instructions including the URL, link ID, and edition ID"],
     ) -> str:
         """Fetch and extract content from a submitted URL."""
-        response = await self.fetch.agent.run(task)
+        response = await retry_transient("fetch", lambda: self.fetch.agent.run(task))
         return self._capture_usage(response)
 
     @tool(name="review")
@@ -72,7 +172,7 @@ class OrchestratorToolsMixin:
         task: Annotated[str, "Instructions including the link ID and edition ID"],
     ) -> str:
         """Evaluate relevance, extract insights, categorize content."""
-        response = await self.review.agent.run(task)
+        response = await retry_transient("review", lambda: self.review.agent.run(task))
         return self._capture_usage(response)
 
     @tool(name="draft")
@@ -81,7 +181,9 @@ class OrchestratorToolsMixin:
         task: Annotated[str, "Instructions including the link ID and edition ID"],
     ) -> str:
         """Compose newsletter content from reviewed material."""
-        response = await self.draft.run_guardrailed(task)
+        response = await retry_transient(
+            "draft", lambda: self.draft.run_guardrailed(task)
+        )
         return self._capture_usage(response)
 
     @tool(name="edit")
@@ -91,18 +193,23 @@ class OrchestratorToolsMixin:
     ) -> str:
         """Refine edition content and address editor feedback."""
         ctx = feedback_ctx.get()
-        session = self.edit.agent.create_session()
-        if ctx:
-            if ctx.get("skip_memory_capture"):
+        skip_memory_capture = bool(ctx and ctx.get("skip_memory_capture"))
+        if ctx and not skip_memory_capture and ctx.get("comment"):
+            # Include feedback content so the memory provider captures it
+            task += (
+                f"\n\nEditor's original feedback:"
+                f"\nSection: {ctx['section']}"
+                f"\nComment: {ctx['comment']}"
+            )
+
+        async def _run() -> object:
+            # Fresh session per attempt so a failed call leaves no partial history
+            session = self.edit.agent.create_session()
+            if skip_memory_capture:
                 session.state["skip_memory_capture"] = True
-            elif ctx.get("comment"):
-                # Include feedback content so the memory provider captures it
-                task += (
-                    f"\n\nEditor's original feedback:"
-                    f"\nSection: {ctx['section']}"
-                    f"\nComment: {ctx['comment']}"
-                )
-        response = await self.edit.agent.run(task, session=session)
+            return await self.edit.agent.run(task, session=session)
+
+        response = await retry_transient("edit", _run)
         return self._capture_usage(response)
 
     @tool(name="publish")
@@ -111,7 +218,9 @@ class OrchestratorToolsMixin:
         task: Annotated[str, "Instructions including the edition ID"],
     ) -> str:
         """Render HTML and upload to storage."""
-        response = await self.publish.agent.run(task)
+        response = await retry_transient(
+            "publish", lambda: self.publish.agent.run(task)
+        )
         return self._capture_usage(response)
 
     @tool
@@ -123,7 +232,7 @@ class OrchestratorToolsMixin:
         """Get the current status and metadata of a link."""
         link = await self._links_repo.get(link_id, link_id)
         if not link:
-            return json.dumps({"error": "Link not found"})
+            return _LINK_NOT_FOUND
         return json.dumps(
             {
                 "id": link.id,
@@ -144,7 +253,7 @@ class OrchestratorToolsMixin:
         """Get the current status of an edition."""
         edition = await self._editions_repo.get(edition_id, edition_id)
         if not edition:
-            return json.dumps({"error": "Edition not found"})
+            return _EDITION_NOT_FOUND
         return json.dumps(
             {
                 "id": edition.id,
@@ -162,27 +271,27 @@ class OrchestratorToolsMixin:
         edition_id: Annotated[str, "ID of the edition this run belongs to"],
     ) -> str:
         """Record the start of a pipeline stage. Call before invoking a sub-agent."""
-        run = AgentRun(
-            stage=AgentStage(stage),
-            edition_id=edition_id,
-            trigger_id=trigger_id,
-            input={"stage": stage},
-            started_at=datetime.now(UTC),
-        )
-        await self._agent_runs_repo.create(run)
-        await self._events.publish(
-            "agent-run-start",
-            {
-                "id": run.id,
-                "stage": run.stage,
-                "trigger_id": run.trigger_id,
-                "edition_id": run.edition_id,
-                "status": run.status,
-                "started_at": run.started_at.isoformat() if run.started_at else None,
-            },
-        )
+        run = await self._start_stage(stage, trigger_id, edition_id)
+        if len(self._open_stage_runs) >= _MAX_OPEN_STAGE_RUNS:
+            # Drop only the oldest open run; the rest are likely still live.
+            self._open_stage_runs.popitem(last=False)
+        self._open_stage_runs[run.id] = run
         return json.dumps({"run_id": run.id, "stage": stage, "status": "running"})
 
+    async def _load_stage_run(
+        self, run_id: str, trigger_id: str, edition_id: str
+    ) -> AgentRun | None:
+        """Read back a stage run that is no longer cached in memory."""
+        run = await self._agent_runs_repo.get(run_id, edition_id)
+        link_runs = self._link_runs.get(trigger_id)
+        if run is not None and link_runs is not None:
+            # Swap in the loaded copy so in-flight row refreshes see its outcome.
+            for index, cached in enumerate(link_runs):
+                if cached.id == run_id:
+                    link_runs[index] = run
+                    break
+        return run
+
     @tool
     async def record_stage_complete(
         self,
@@ -196,47 +305,28 @@ class OrchestratorToolsMixin:
         total_tokens: Annotated[int, "Total tokens consumed by this stage"] = 0,
     ) -> str:
         """Record the completion of a pipeline stage."""
-        run = await self._agent_runs_repo.get(run_id, edition_id)
+        run = self._open_stage_runs.get(run_id)
+        if run is None:
+            run = await self._load_stage_run(run_id, trigger_id, edition_id)
         if not run:
-            return json.dumps({"error": "Run not found"})
-        run.status = (
-            AgentRunStatus.COMPLETED if status == "completed" else AgentRunStatus.FAILED
-        )
-        run.completed_at = datetime.now(UTC)
-        if error:
-            run.output = {"error": error}
+            return _RUN_NOT_FOUND
         if input_tokens or output_tokens or total_tokens:
-            run.usage = {
+            usage = {
                 "input_tokens": input_tokens,
                 "output_tokens": output_tokens,
                 "total_tokens": total_tokens or input_tokens + output_tokens,
             }
-        elif self._last_stage_usage:
-            run.usage = self._last_stage_usage
+        else:
+            usage = self._last_stage_usage
         self._last_stage_usage = None
-        await self._agent_runs_repo.update(run, edition_id)
-        await self._events.publish(
-            "agent-run-complete",
-            {
-                "id": run.id,
-                "stage": run.stage,
-                "trigger_id": run.trigger_id,
-                "edition_id": run.edition_id,
-                "status": run.status,
-                "output": run.output,
-                "usage": run.usage,
-                "started_at": run.started_at.isoformat() if run.started_at else None,
-                "completed_at": run.completed_at.isoformat()
-                if run.completed_at
-                else None,
-            },
+        await self._finish_stage(
+            run,
+            trigger_id,
+            failed=status != "completed",
+            error=error,
+            usage=usage,
         )
 
-        link = await self._links_repo.get(trigger_id, trigger_id)
-        if link:
-            runs = await self._agent_runs_repo.get_by_trigger(trigger_id)
-            await self._events.publish("link-update", render_link_row(link, runs))
-
         return json.dumps(
             {
                 "run_id": run_id,
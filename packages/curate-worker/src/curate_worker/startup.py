@@ -115,7 +115,7 @@ async def init_memory(settings: Settings) -> list | None:
         return None
 
 
-async def init_pipeline(
+async def init_pipeline(  # noqa: PLR0913
     chat_client: BaseChatClient,
     cosmos: CosmosClient,
     editions_repo: EditionRepository,
@@ -123,6 +123,9 @@ async def init_pipeline(
     render_fn: Callable[..., Awaitable] | None = None,
     upload_fn: Callable[..., Awaitable] | None = None,
     context_providers: list | None = None,
+    max_concurrency: int = 8,
+    *,
+    link_fast_path: bool = False,
 ) -> ChangeFeedProcessor:
     """Create the orchestrator, recover orphaned runs, and start the change feed."""
     orchestrator = PipelineOrchestrator(
@@ -136,6 +139,8 @@ async def init_pipeline(
         upload_fn=upload_fn,
         context_providers=context_providers,
         revisions_repo=RevisionRepository(cosmos.database),
+        max_concurrency=max_concurrency,
+        link_fast_path=link_fast_path,
     )
 
     agent_runs_repo = AgentRunRepository(cosmos.database)
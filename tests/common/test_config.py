@@ -53,6 +53,22 @@ def test_app_config_is_development_false() -> None:
     assert config.is_development is False
 
 
+def test_app_config_orchestrator_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify orchestrator concurrency defaults and reads from env."""
+    monkeypatch.delenv("APP_ORCHESTRATOR_CONCURRENCY", raising=False)
+    assert AppConfig().orchestrator_concurrency == 8  # noqa: PLR2004
+    monkeypatch.setenv("APP_ORCHESTRATOR_CONCURRENCY", "2")
+    assert AppConfig().orchestrator_concurrency == 2  # noqa: PLR2004
+
+
+def test_app_config_link_fast_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify the link fast path is opt-in."""
+    monkeypatch.delenv("APP_LINK_FAST_PATH", raising=False)
+    assert AppConfig().link_fast_path is False
+    monkeypatch.setenv("APP_LINK_FAST_PATH", "true")
+    assert AppConfig().link_fast_path is True
+
+
 def test_cosmos_config_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
     """Verify cosmos config defaults."""
     monkeypatch.setenv("AZURE_COSMOS_ENDPOINT", "https://cosmos.example.com")
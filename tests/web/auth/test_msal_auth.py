@@ -63,3 +63,26 @@ def test_complete_auth_returns_result_on_success(mock_msal_class: MagicMock) ->
     result = auth.complete_auth({}, {"code": "abc"})
 
     assert result == token_result
+
+
+@patch("curate_web.auth.msal_auth.msal.ConfidentialClientApplication")
+def test_sign_ins_do_not_share_a_token_cache(mock_msal_class: MagicMock) -> None:
+    """Verify each sign-in gets its own client and only discovery is shared."""
+    mock_msal_class.side_effect = lambda **_: MagicMock(
+        acquire_token_by_auth_code_flow=MagicMock(return_value={"access_token": "t"})
+    )
+
+    config = EntraConfig.__new__(EntraConfig)
+    object.__setattr__(config, "tenant_id", "tenant-1")
+    object.__setattr__(config, "client_id", "client-1")
+    object.__setattr__(config, "client_secret", "secret")
+    object.__setattr__(config, "redirect_uri", "http://localhost/callback")
+
+    auth = MSALAuth(config)
+    auth.complete_auth({}, {"code": "a"})
+    auth.complete_auth({}, {"code": "b"})
+
+    first, second = mock_msal_class.call_args_list
+    assert "token_cache" not in first.kwargs
+    assert first.kwargs["http_cache"] is second.kwargs["http_cache"]
+    assert mock_msal_class.call_count == 2  # noqa: PLR2004
@@ -51,6 +51,23 @@ class TestEventManagerPublish:
         manager = EventManager.get_instance()
         await manager.publish("test", {"ok": True})
 
+    async def test_publish_skips_serialization_without_subscribers(self) -> None:
+        """Verify payloads are not serialized when no client is listening."""
+        manager = EventManager.get_instance()
+        assert not manager.has_subscribers()
+
+        with patch("curate_web.events.json.dumps") as dumps:
+            await manager.publish("link-update", {"id": "l-1"})
+
+        dumps.assert_not_called()
+
+    async def test_has_subscribers_tracks_queues(self) -> None:
+        """Verify has_subscribers reflects connected clients."""
+        manager = EventManager.get_instance()
+        manager.queues.append(asyncio.Queue())
+
+        assert manager.has_subscribers()
+
 
 class TestEventManagerEventGenerator:
     """Test the Event Manager Event Generator."""
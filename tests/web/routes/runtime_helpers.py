@@ -1,13 +1,22 @@
-"""Helpers for constructing typed route runtime objects in tests."""
+"""Helpers for constructing typed route runtime objects in tests.
+
+Also home to ``OverlapTracker``, shared by tests that assert awaited calls
+run concurrently.
+"""
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
-from unittest.mock import MagicMock
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
 
 from curate_web.events import EventManager
 from curate_web.runtime import WebRuntime
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 def make_runtime(  # noqa: PLR0913
     *,
@@ -36,3 +45,33 @@ def make_runtime(  # noqa: PLR0913
         event_consumer=event_consumer,
         realtime_enabled=realtime_enabled,
     )
+
+
+class OverlapTracker:
+    """Build async mocks that record how many of their calls overlap.
+
+    Every mock from one tracker shares the same counters, so ``peak`` is the
+    most calls in flight at once across all of them.
+    """
+
+    def __init__(self, delay: float = 0) -> None:
+        """Hold each call open for ``delay`` seconds before it returns."""
+        self.in_flight = 0
+        self.peak = 0
+        self._delay = delay
+
+    def track(self, result: Callable[..., object]) -> AsyncMock:
+        """Return a mock whose calls are counted and answered by ``result``."""
+
+        async def _call(*args: object, **kwargs: object) -> object:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(self._delay)
+            self.in_flight -= 1
+            return result(*args, **kwargs)
+
+        return AsyncMock(side_effect=_call)
+
+    def returning(self, value: object) -> AsyncMock:
+        """Return a counted mock that always resolves to ``value``."""
+        return self.track(lambda *_args, **_kwargs: value)
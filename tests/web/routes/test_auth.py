@@ -77,3 +77,21 @@ class TestAuthRoutes:
         assert response.status_code == _EXPECTED_REDIRECT_STATUS
         assert response.headers["location"] == "/auth/login"
         assert len(session) == 0
+
+    async def test_msal_helper_is_shared_across_requests(self) -> None:
+        """Login and callback reuse the runtime's MSAL helper."""
+        runtime = make_runtime()
+        request = MagicMock()
+        request.app.state.runtime = runtime
+        request.session = {}
+        request.query_params = {}
+
+        with patch("curate_web.routes.auth.MSALAuth") as mock_auth_cls:
+            mock_auth_cls.return_value.get_auth_flow.return_value = {"auth_uri": "/"}
+            mock_auth_cls.return_value.complete_auth.return_value = None
+
+            await login(request)
+            await callback(request)
+
+        mock_auth_cls.assert_called_once_with(runtime.settings.entra)
+        assert runtime.msal_auth is mock_auth_cls.return_value
@@ -15,6 +15,7 @@ from curate_web.routes.editions import (
 from tests.web.routes.runtime_helpers import make_runtime
 
 _EXPECTED_REDIRECT_STATUS = 303
+_EXPECTED_NOT_FOUND_STATUS = 404
 _NEXT_ISSUE_NUMBER = 3
 
 
@@ -121,6 +122,21 @@ async def test_edition_detail_renders_template() -> None:
         assert call_args[0][0] == "workspace.html"
 
 
+async def test_edition_detail_missing_edition_returns_404() -> None:
+    """GET /editions/{id} renders the not-found page with a 404 status."""
+    request = _make_request()
+
+    with patch(
+        "curate_web.routes.editions.edition_svc.get_workspace_data",
+        new_callable=AsyncMock,
+        return_value={"edition": None},
+    ):
+        await edition_detail(request, edition_id="missing")
+
+    call_args = request.app.state.templates.TemplateResponse.call_args
+    assert call_args.kwargs["status_code"] == _EXPECTED_NOT_FOUND_STATUS
+
+
 async def test_publish_edition_schedules_background_publish() -> None:
     """POST /editions/{id}/publish schedules publish and redirects."""
     request = _make_request()
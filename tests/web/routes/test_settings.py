@@ -14,7 +14,7 @@ from curate_web.routes.settings import (
     toggle_memory,
 )
 from curate_web.services.health import ServiceHealth
-from tests.web.routes.runtime_helpers import make_runtime
+from tests.web.routes.runtime_helpers import OverlapTracker, make_runtime
 
 _MOCK_TOKEN_TOTALS = {"input_tokens": 100, "output_tokens": 50, "total_tokens": 150}
 
@@ -135,6 +135,31 @@ class TestSettingsPage:
         assert call_args[0][1]["memory_enabled"] is True
         assert "token_usage" in call_args[0][1]
 
+    async def test_lists_both_scopes_concurrently(self) -> None:
+        """Project and personal memories are fetched together and kept apart."""
+        tracker = OverlapTracker()
+        service = MagicMock()
+        service.enabled = True
+        service.store_name = "test-store"
+        service.list_memories = tracker.track(
+            lambda scope: [{"memory_id": scope, "content": ""}]
+        )
+        request = _make_request(memory_service=service, user={"oid": "abc"})
+        mock_repo = MagicMock()
+        mock_repo.aggregate_token_usage = AsyncMock(return_value=_MOCK_TOKEN_TOTALS)
+        with (
+            patch("curate_web.routes.settings.check_all", new_callable=AsyncMock),
+            patch(
+                "curate_web.routes.settings.get_agent_run_repository",
+                return_value=mock_repo,
+            ),
+        ):
+            await settings_page(request)
+        context = request.app.state.templates.TemplateResponse.call_args[0][1]
+        assert tracker.peak > 1
+        assert context["project_memories"][0]["memory_id"] == "project-editorial"
+        assert context["personal_memories"][0]["memory_id"] == "user-abc"
+
     async def test_renders_when_memory_disabled_by_config(self) -> None:
         """Verify rendering state when memory is disabled via environment config."""
         settings = _make_settings_namespace()
@@ -8,6 +8,7 @@ from curate_web.services.agent_runs import (
     get_agents_page_data,
     group_runs_by_invocation,
 )
+from tests.web.routes.runtime_helpers import OverlapTracker
 
 
 class TestGroupRunsByInvocation:
@@ -64,6 +65,17 @@ class TestGroupRunsByInvocation:
         assert len(result) == 1
         assert result[0] == [fetch, review]
 
+    def test_orphan_stages_before_orchestrator(self) -> None:
+        """Stages ahead of the first orchestrator run form their own group."""
+        fetch = MagicMock()
+        fetch.stage = "fetch"
+        orch = MagicMock()
+        orch.stage = "orchestrator"
+        review = MagicMock()
+        review.stage = "review"
+        result = group_runs_by_invocation([fetch, orch, review])
+        assert result == [[fetch], [orch, review]]
+
 
 class TestGetAgentsPageData:
     """Tests for get_agents_page_data."""
@@ -97,3 +109,25 @@ class TestGetAgentsPageData:
         assert result["agents"][0]["recent_runs"] == []
         assert result["agents"][0]["last_run"] is None
         assert result["agents"][0]["is_running"] is False
+
+    async def test_queries_stages_concurrently(self) -> None:
+        """Per-stage queries are issued together and mapped back by stage."""
+        tracker = OverlapTracker()
+
+        def _list(stage: str, *, limit: int) -> list[MagicMock]:  # noqa: ARG001
+            return [MagicMock(status="running")] if stage == "review" else []
+
+        runs_repo = MagicMock()
+        runs_repo.list_recent_by_stage = tracker.track(_list)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(
+                "curate_common.agents.registry.get_agent_metadata",
+                lambda: [{"name": "review"}, {"name": "fetch"}],
+            )
+            result = await get_agents_page_data(runs_repo)
+
+        assert tracker.peak > 1
+        assert result["running_stages"] == {"review"}
+        assert result["agents"][0]["is_running"] is True
+        assert result["agents"][1]["recent_runs"] == []
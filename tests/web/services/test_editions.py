@@ -0,0 +1,99 @@
+"""Tests for edition service data assembly."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from curate_common.models.edition import Edition
+from curate_common.models.link import Link
+from curate_web.services.editions import get_edition_detail, get_workspace_data
+from tests.web.routes.runtime_helpers import OverlapTracker
+
+
+def _repos(
+    edition: Edition | None, links: list[Link]
+) -> tuple[MagicMock, MagicMock, MagicMock, OverlapTracker]:
+    tracker = OverlapTracker()
+    editions_repo = MagicMock()
+    editions_repo.get = tracker.returning(edition)
+    links_repo = MagicMock()
+    links_repo.get_by_edition = tracker.returning(links)
+    links_repo.list_unattached = tracker.returning([])
+    runs_repo = MagicMock()
+    runs_repo.get_by_triggers = AsyncMock(return_value=[])
+    runs_repo.list_by_edition = tracker.returning([])
+    return editions_repo, links_repo, runs_repo, tracker
+
+
+class TestGetEditionDetail:
+    """Tests for get_edition_detail."""
+
+    async def test_fetches_edition_and_links_concurrently(self) -> None:
+        """The edition and its links are loaded in parallel."""
+        edition = Edition(id="ed-1", content={})
+        link = Link(id="link-1", url="https://example.com", edition_id="ed-1")
+        editions_repo, links_repo, runs_repo, tracker = _repos(edition, [link])
+
+        result = await get_edition_detail("ed-1", editions_repo, links_repo, runs_repo)
+
+        assert tracker.peak > 1
+        assert result["links"] == [link]
+        runs_repo.get_by_triggers.assert_awaited_once_with(["link-1"])
+
+    async def test_missing_edition_discards_links(self) -> None:
+        """Links are dropped and runs skipped when the edition is gone."""
+        link = Link(id="link-1", url="https://example.com", edition_id="ed-1")
+        editions_repo, links_repo, runs_repo, _ = _repos(None, [link])
+
+        result = await get_edition_detail("ed-1", editions_repo, links_repo, runs_repo)
+
+        assert result["edition"] is None
+        assert result["links"] == []
+        runs_repo.get_by_triggers.assert_not_awaited()
+
+
+class TestGetWorkspaceData:
+    """Tests for get_workspace_data."""
+
+    async def test_fetches_independent_queries_concurrently(self) -> None:
+        """Workspace queries overlap instead of running one after another."""
+        edition = Edition(id="ed-1", content={})
+        editions_repo, links_repo, runs_repo, tracker = _repos(edition, [])
+        feedback_repo = MagicMock()
+        feedback_repo.get_by_edition = tracker.returning([])
+
+        result = await get_workspace_data(
+            "ed-1", editions_repo, links_repo, runs_repo, feedback_repo
+        )
+
+        assert tracker.peak > 2  # noqa: PLR2004
+        assert result["edition"] is edition
+
+    async def test_indexes_links_and_groups_their_runs(self) -> None:
+        """Each link is indexed by ID with its runs grouped by invocation."""
+        edition = Edition(id="ed-1", content={})
+        link = Link(id="link-1", url="https://example.com", edition_id="ed-1")
+        editions_repo, links_repo, runs_repo, _ = _repos(edition, [link])
+        orchestrator = MagicMock(trigger_id="link-1", stage="orchestrator")
+        fetch = MagicMock(trigger_id="link-1", stage="fetch")
+        orchestrator.started_at, fetch.started_at = 1, 2
+        runs_repo.list_by_edition = AsyncMock(return_value=[fetch, orchestrator])
+        feedback_repo = MagicMock()
+        feedback_repo.get_by_edition = AsyncMock(return_value=[])
+
+        result = await get_workspace_data(
+            "ed-1", editions_repo, links_repo, runs_repo, feedback_repo
+        )
+
+        assert result["links_by_id"] == {"link-1": link}
+        assert result["link_run_groups"] == {"link-1": [[orchestrator, fetch]]}
+
+    async def test_missing_edition_skips_assembly(self) -> None:
+        """A missing edition returns only the not-found marker."""
+        editions_repo, links_repo, runs_repo, _ = _repos(None, [])
+        feedback_repo = MagicMock()
+        feedback_repo.get_by_edition = AsyncMock(return_value=[])
+
+        result = await get_workspace_data(
+            "ed-1", editions_repo, links_repo, runs_repo, feedback_repo
+        )
+
+        assert result == {"edition": None}
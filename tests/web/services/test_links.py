@@ -0,0 +1,54 @@
+"""Tests for link service — deletion and edition cleanup."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from curate_common.models.edition import Edition
+from curate_common.models.link import Link, LinkStatus
+from curate_web.services.links import delete_link
+
+
+class TestDeleteLink:
+    """Tests for delete_link."""
+
+    async def test_resets_remaining_drafted_links(self) -> None:
+        """Deleting a drafted link clears content and re-reviews the others."""
+        link = Link(id="link-1", url="https://a.example", edition_id="ed-1")
+        others = [
+            Link(id=f"link-{i}", url="https://b.example", status=LinkStatus.DRAFTED)
+            for i in (2, 3)
+        ]
+        edition = Edition(
+            id="ed-1", content={"title": "x"}, link_ids=["link-1", "link-2", "link-3"]
+        )
+        links_repo = MagicMock()
+        links_repo.get = AsyncMock(return_value=link)
+        links_repo.soft_delete = AsyncMock()
+        links_repo.get_by_status = AsyncMock(return_value=others)
+        links_repo.update = AsyncMock()
+        editions_repo = MagicMock()
+        editions_repo.get = AsyncMock(return_value=edition)
+        editions_repo.update = AsyncMock()
+
+        result = await delete_link("link-1", links_repo, editions_repo)
+
+        assert result is edition
+        assert edition.link_ids == ["link-2", "link-3"]
+        assert edition.content == {}
+        assert all(other.status == LinkStatus.REVIEWED for other in others)
+        assert [c.args[1] for c in links_repo.update.await_args_list] == [
+            "link-2",
+            "link-3",
+        ]
+
+    async def test_unattached_link_skips_edition(self) -> None:
+        """A store-only link is soft-deleted without touching editions."""
+        link = Link(id="link-1", url="https://a.example")
+        links_repo = MagicMock()
+        links_repo.get = AsyncMock(return_value=link)
+        links_repo.soft_delete = AsyncMock()
+        editions_repo = MagicMock()
+        editions_repo.get = AsyncMock()
+
+        assert await delete_link("link-1", links_repo, editions_repo) is None
+        links_repo.soft_delete.assert_awaited_once_with(link, "link-1")
+        editions_repo.get.assert_not_awaited()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -179,6 +180,20 @@ class TestClearMemories:
             scope="test-scope",
         )
 
+    async def test_clears_off_the_event_loop(
+        self,
+        service: MemoryService,
+        mock_project_client: MagicMock,
+    ) -> None:
+        """Verify the synchronous SDK call runs in a worker thread."""
+        threads: list[int] = []
+        mock_project_client.memory_stores.delete_scope.side_effect = lambda **_: (
+            threads.append(threading.get_ident())
+        )
+        await service.clear_memories("test-scope")
+        assert threads
+        assert threads[0] != threading.get_ident()
+
     async def test_handles_clear_failure(
         self,
         service: MemoryService,
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from types import SimpleNamespace
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
-from curate_web.app import create_app
+from curate_web.app import _create_templates, create_app
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def _settings(*, servicebus_connection_string: str) -> SimpleNamespace:
@@ -120,3 +124,21 @@ def test_lifespan_skips_event_bridge_when_servicebus_not_configured() -> None:
 
     consumer_cls.assert_not_called()
     publisher_cls.assert_not_called()
+
+
+@pytest.mark.parametrize("auto_reload", [True, False])
+def test_templates_are_compiled_at_startup(
+    tmp_path: Path, *, auto_reload: bool
+) -> None:
+    """Templates are compiled once up front; reload checks follow the env."""
+    (tmp_path / "page.html").write_text("<p>{{ name }}</p>")
+    (tmp_path / "partials").mkdir()
+    (tmp_path / "partials" / "row.html").write_text("<tr></tr>")
+
+    templates = _create_templates(tmp_path, auto_reload=auto_reload)
+
+    env = templates.env
+    assert env.auto_reload is auto_reload
+    assert env.cache is not None
+    assert len(env.cache) == 2  # noqa: PLR2004
+    assert env.get_template("page.html").render(name="<b>") == "<p>&lt;b&gt;</p>"
@@ -0,0 +1,27 @@
+"""Tests for runtime repository providers."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from curate_web.dependencies import get_agent_run_repository, get_link_repository
+from tests.web.routes.runtime_helpers import make_runtime
+
+
+def test_repositories_are_shared_per_runtime() -> None:
+    """Each provider builds its repository once and then reuses it."""
+    cosmos = MagicMock()
+    runtime = make_runtime(cosmos=cosmos)
+
+    runs_repo = get_agent_run_repository(runtime)
+
+    assert get_agent_run_repository(runtime) is runs_repo
+    assert get_link_repository(runtime) is not runs_repo
+    assert cosmos.database.get_container_client.call_count == 2  # noqa: PLR2004
+
+
+def test_runtimes_do_not_share_repositories() -> None:
+    """Repositories are bound to the runtime whose database they use."""
+    assert get_link_repository(make_runtime()) is not get_link_repository(
+        make_runtime()
+    )
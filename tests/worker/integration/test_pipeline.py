@@ -54,7 +54,7 @@ def orchestrator(
             return_value=MagicMock(text="done")
         )
         orch._runs = MagicMock()  # noqa: SLF001
-        orch._runs.create_orchestrator_run = AsyncMock()  # noqa: SLF001
+        orch._runs.create_orchestrator_run = AsyncMock(return_value=MagicMock())  # noqa: SLF001
         orch._runs.publish_run_event = AsyncMock()  # noqa: SLF001
         return orch
 
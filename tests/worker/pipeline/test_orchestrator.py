@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+from datetime import UTC, datetime
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -12,6 +14,9 @@ import pytest
 from curate_common.models.link import LinkStatus
 from curate_worker.pipeline.orchestrator import PipelineOrchestrator
 from curate_worker.pipeline.runs import RunManager
+from curate_worker.pipeline.scheduling import PrioritySemaphore
+from curate_worker.pipeline.tools import feedback_ctx
+from tests.web.routes.runtime_helpers import OverlapTracker
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -52,13 +57,13 @@ def orchestrator(
             runs,
             event_publisher=mock_publisher,
         )
-        orch._runs = MagicMock()  # noqa: SLF001
-        orch._runs.create_orchestrator_run = AsyncMock()  # noqa: SLF001
+        orch._runs.create_orchestrator_run = AsyncMock(return_value=MagicMock())  # noqa: SLF001
         orch._runs.publish_run_event = AsyncMock()  # noqa: SLF001
         return orch
 
 
 _START_EVENT_KEYS = {"id", "stage", "trigger_id", "edition_id", "status", "started_at"}
+_COMPLETE_EVENT_KEYS = _START_EVENT_KEYS | {"output", "usage", "completed_at"}
 
 
 class TestNormalizeUsage:
@@ -91,6 +96,12 @@ class TestNormalizeUsage:
         expected_total = 100
         assert result["total_tokens"] == expected_total
 
+    def test_accepts_read_only_mapping(self) -> None:
+        """Read usage details in place without requiring a dict copy."""
+        raw = MappingProxyType({"input_token_count": 3, "output_token_count": 4})
+        result = RunManager.normalize_usage(raw)
+        assert result == {"input_tokens": 3, "output_tokens": 4, "total_tokens": 7}
+
 
 class TestStartEventPayloads:
     """Verify start-event payload schema for all emitters."""
@@ -105,6 +116,7 @@ class TestStartEventPayloads:
         run = await manager.create_orchestrator_run(
             "ed-1", "l-1", {"status": "submitted"}
         )
+        await manager.close()
 
         event_name, payload = events.publish.call_args.args
         assert event_name == "agent-run-start"
@@ -124,6 +136,7 @@ class TestStartEventPayloads:
         _links, _editions, _feedback, runs = mock_repos
 
         await orchestrator.record_stage_start("fetch", "l-1", "ed-1")
+        await orchestrator._runs.flush()  # noqa: SLF001
 
         created_run = runs.create.call_args.args[0]
         event_name, payload = orchestrator._events.publish.call_args.args  # noqa: SLF001
@@ -136,6 +149,32 @@ class TestStartEventPayloads:
         assert payload["status"] == created_run.status
 
 
+class TestCompleteEventPayloads:
+    """Verify complete-event payload schema for all emitters."""
+
+    async def test_run_manager_formats_timestamps(
+        self,
+        make_agent_run: Callable[..., AgentRun],
+    ) -> None:
+        """RunManager complete events carry ISO timestamps and edition_id."""
+        events = MagicMock()
+        events.publish = AsyncMock()
+        manager = RunManager(AsyncMock(), events)
+        started = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+        completed = datetime(2025, 1, 1, 12, 5, tzinfo=UTC)
+        run = make_agent_run(started_at=started, completed_at=completed)
+
+        await manager.publish_run_event(run)
+        await manager.close()
+
+        event_name, payload = events.publish.call_args.args
+        assert event_name == "agent-run-complete"
+        assert set(payload) == _COMPLETE_EVENT_KEYS
+        assert payload["edition_id"] == run.edition_id
+        assert payload["started_at"] == started.isoformat()
+        assert payload["completed_at"] == completed.isoformat()
+
+
 class TestHandleLinkChangeUsage:
     """Verify handle_link_change persists token usage on the orchestrator run."""
 
@@ -301,6 +340,113 @@ class TestRecordStageCompleteUsage:
         assert run.usage["total_tokens"] == expected_total
 
 
+class TestRunEventQueue:
+    """Tests for RunManager background run-event publication."""
+
+    async def test_publish_does_not_wait_for_event_bus(
+        self,
+        make_agent_run: Callable[..., AgentRun],
+    ) -> None:
+        """A slow event bus does not block publish_run_event callers."""
+        release = asyncio.Event()
+        events = MagicMock()
+
+        async def _slow_publish(*_args: object) -> None:
+            await release.wait()
+
+        events.publish = AsyncMock(side_effect=_slow_publish)
+        manager = RunManager(AsyncMock(), events)
+
+        await asyncio.wait_for(manager.publish_run_event(make_agent_run()), 1)
+
+        release.set()
+        await manager.close()
+        events.publish.assert_awaited_once()
+
+    async def test_close_flushes_events_in_order(
+        self,
+        make_agent_run: Callable[..., AgentRun],
+    ) -> None:
+        """Queued events are all published, in order, before close returns."""
+        events = MagicMock()
+        events.publish = AsyncMock(side_effect=[RuntimeError("bus down"), None, None])
+        manager = RunManager(AsyncMock(), events)
+        runs = [make_agent_run(id=f"run-{n}") for n in range(3)]
+
+        for run in runs:
+            await manager.publish_run_event(run)
+        await manager.close()
+
+        published = [call.args[1]["id"] for call in events.publish.call_args_list]
+        assert published == ["run-0", "run-1", "run-2"]
+
+    async def test_stage_writes_land_before_their_events(
+        self,
+        make_agent_run: Callable[..., AgentRun],
+    ) -> None:
+        """Stage runs are created inline, then updated before the SSE events."""
+        order: list[str] = []
+        repo = AsyncMock()
+        repo.create.side_effect = lambda *_: order.append("create")
+        repo.update.side_effect = lambda *_: order.append("update")
+        events = MagicMock()
+        events.publish = AsyncMock(side_effect=lambda name, _: order.append(name))
+        manager = RunManager(repo, events)
+        run = make_agent_run(id="run-1")
+
+        await manager.create_stage_run(run)
+        assert order == ["create"]
+        await manager.complete_stage_run(run)
+        await manager.flush()
+
+        assert order == [
+            "create",
+            "agent-run-start",
+            "update",
+            "agent-run-complete",
+        ]
+        await manager.close()
+
+    async def test_failed_stage_create_reaches_caller(
+        self,
+        make_agent_run: Callable[..., AgentRun],
+    ) -> None:
+        """A failed create raises instead of queuing its start event."""
+        repo = AsyncMock()
+        repo.create.side_effect = RuntimeError("cosmos down")
+        events = MagicMock()
+        events.publish = AsyncMock()
+        manager = RunManager(repo, events)
+
+        with pytest.raises(RuntimeError, match="cosmos down"):
+            await manager.create_stage_run(make_agent_run(id="run-1"))
+        await manager.flush()
+
+        events.publish.assert_not_awaited()
+        await manager.close()
+
+    async def test_drain_does_not_inherit_caller_context(
+        self,
+        make_agent_run: Callable[..., AgentRun],
+    ) -> None:
+        """Queued work is not attributed to the handler that started the drain."""
+        seen: list[dict | None] = []
+        events = MagicMock()
+        events.publish = AsyncMock(
+            side_effect=lambda *_: seen.append(feedback_ctx.get())
+        )
+        manager = RunManager(AsyncMock(), events)
+
+        token = feedback_ctx.set({"comment": "first handler"})
+        try:
+            await manager.publish_run_event(make_agent_run())
+        finally:
+            feedback_ctx.reset(token)
+        await manager.close()
+
+        assert seen == [None]
+
+
 class TestClaimLink:
     """Tests for _claim_link guard logic."""
 
@@ -342,6 +488,115 @@ class TestClaimLink:
         result = await orchestrator._claim_link("l-1", "submitted")  # noqa: SLF001
         assert result == claimed_link
 
+    async def test_skips_link_already_in_flight(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A duplicate event for an in-flight link skips the repository claim."""
+        links, *_ = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-1", status="submitted")
+
+        first = await orchestrator._claim_link("l-1", "submitted")  # noqa: SLF001
+        second = await orchestrator._claim_link("l-1", "submitted")  # noqa: SLF001
+
+        assert first is not None
+        assert second is None
+        links.claim_submitted.assert_awaited_once_with("l-1")
+
+    async def test_rejected_claim_releases_link(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+    ) -> None:
+        """A rejected claim does not block later events for the same link."""
+        links, *_ = mock_repos
+        links.claim_submitted.return_value = None
+
+        await orchestrator._claim_link("l-1", "submitted")  # noqa: SLF001
+        await orchestrator._claim_link("l-1", "submitted")  # noqa: SLF001
+
+        assert links.claim_submitted.await_count == 2  # noqa: PLR2004
+
+    async def test_failed_claim_releases_link(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+    ) -> None:
+        """A claim that raises leaves the link free for the redelivered event."""
+        links, *_ = mock_repos
+        links.claim_submitted.side_effect = [RuntimeError("503"), None]
+        document = {
+            "id": "l-1",
+            "edition_id": "ed-1",
+            "status": "submitted",
+            "_etag": '"v1"',
+        }
+
+        with pytest.raises(RuntimeError):
+            await orchestrator.handle_link_change(document)
+        await orchestrator.handle_link_change(document)
+
+        assert "l-1" not in orchestrator._active_links  # noqa: SLF001
+        assert links.claim_submitted.await_count == 2  # noqa: PLR2004
+
+    async def test_handled_versions_evict_oldest(
+        self,
+        orchestrator: PipelineOrchestrator,
+    ) -> None:
+        """A full version set forgets its oldest entry rather than all of them."""
+        with patch("curate_worker.pipeline.orchestrator._MAX_HANDLED_VERSIONS", 2):
+            for n in range(3):
+                orchestrator._remember_version(("l-1", f'"v{n}"'))  # noqa: SLF001
+
+        assert list(orchestrator._handled_versions) == [  # noqa: SLF001
+            ("l-1", '"v1"'),
+            ("l-1", '"v2"'),
+        ]
+
+    async def test_handle_link_change_releases_link_when_done(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """The in-flight marker is cleared even when processing fails."""
+        links, *_ = mock_repos
+        link = make_link(id="l-1", status="submitted")
+        links.claim_submitted.return_value = link
+        links.get.return_value = link
+        orchestrator._agent.run = AsyncMock(  # noqa: SLF001
+            side_effect=RuntimeError("boom"),
+        )
+
+        await orchestrator.handle_link_change(
+            {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        assert "l-1" not in orchestrator._active_links  # noqa: SLF001
+
+    async def test_replayed_document_version_skips_claim(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+    ) -> None:
+        """A re-read change-feed document is handled once; new versions are not."""
+        links, *_ = mock_repos
+        links.claim_submitted.return_value = None
+        document = {
+            "id": "l-1",
+            "edition_id": "ed-1",
+            "status": "submitted",
+            "_etag": '"v1"',
+        }
+
+        await orchestrator.handle_link_change(document)
+        await orchestrator.handle_link_change(document)
+        await orchestrator.handle_link_change({**document, "_etag": '"v2"'})
+
+        assert links.claim_submitted.await_count == 2  # noqa: PLR2004
+
 
 class TestHandleLinkChangeRetry:
     """Tests for handle_link_change retry logic."""
@@ -362,7 +617,7 @@ class TestHandleLinkChangeRetry:
         response.text = "ok"
         response.usage_details = None
         orchestrator._agent.run = AsyncMock(  # noqa: SLF001
-            side_effect=[RuntimeError("transient"), response],
+            side_effect=[TimeoutError("transient"), response],
         )
 
         sleep_patch = "curate_worker.pipeline.orchestrator.asyncio.sleep"
@@ -387,7 +642,7 @@ class TestHandleLinkChangeRetry:
         links.get.return_value = link
 
         orchestrator._agent.run = AsyncMock(  # noqa: SLF001
-            side_effect=RuntimeError("persistent error"),
+            side_effect=TimeoutError("persistent timeout"),
         )
 
         sleep_patch = "curate_worker.pipeline.orchestrator.asyncio.sleep"
@@ -398,6 +653,304 @@ class TestHandleLinkChangeRetry:
 
         saved_run = runs.update.call_args[0][0]
         assert saved_run.status == "failed"
+        assert orchestrator._agent.run.await_count == 3  # noqa: PLR2004, SLF001
+
+    async def test_does_not_retry_non_transient_failure(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """Verify a logical failure fails the run after a single attempt."""
+        links, _editions, _feedback, runs = mock_repos
+        link = make_link(id="l-bad", status="submitted")
+        links.claim_submitted.return_value = link
+        links.get.return_value = link
+
+        orchestrator._agent.run = AsyncMock(  # noqa: SLF001
+            side_effect=RuntimeError("bad output"),
+        )
+
+        sleep_patch = "curate_worker.pipeline.orchestrator.asyncio.sleep"
+        with patch(sleep_patch, new_callable=AsyncMock) as sleep:
+            await orchestrator.handle_link_change(
+                {"id": "l-bad", "edition_id": "ed-1", "status": "submitted"}
+            )
+
+        saved_run = runs.update.call_args[0][0]
+        assert saved_run.status == "failed"
+        assert saved_run.output == {"error": "Orchestrator failed after 1 attempts"}
+        assert orchestrator._agent.run.await_count == 1  # noqa: SLF001
+        sleep.assert_not_awaited()
+
+    async def test_marks_link_failed_when_status_unchanged(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A link the orchestrator did not advance is marked failed."""
+        links, *_ = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-1", status="submitted")
+        links.get.return_value = make_link(id="l-1", status="submitted")
+        orchestrator._agent.run = AsyncMock(  # noqa: SLF001
+            side_effect=RuntimeError("bad output"),
+        )
+
+        await orchestrator.handle_link_change(
+            {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+        )
+        await asyncio.gather(*orchestrator._background_tasks)  # noqa: SLF001
+
+        saved_link = links.update.call_args[0][0]
+        assert saved_link.status == LinkStatus.FAILED
+        orchestrator._events.publish.assert_awaited_once()  # noqa: SLF001
+
+    async def test_stalled_row_renders_in_memory_runs(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """The failed-link row shows the finished run without reading it back."""
+        links, _editions, _feedback, runs = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-1", status="submitted")
+        links.get.return_value = make_link(id="l-1", status="submitted")
+        runs.get_by_trigger.return_value = []
+        orchestrator._agent.run = AsyncMock(  # noqa: SLF001
+            side_effect=RuntimeError("bad output"),
+        )
+        render = "curate_worker.pipeline.orchestrator.render_link_row"
+
+        with patch(render, return_value="<tr></tr>") as render_row:
+            await orchestrator.handle_link_change(
+                {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+            )
+            await asyncio.gather(*orchestrator._background_tasks)  # noqa: SLF001
+
+        _, rendered_runs = render_row.call_args[0]
+        assert rendered_runs == [_orchestrator_run(orchestrator)]
+        runs.get_by_trigger.assert_awaited_once()
+
+    async def test_history_read_error_still_finishes_run(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A failed run-history read does not orphan the RUNNING run."""
+        links, _editions, _feedback, runs = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-1", status="submitted")
+        links.get.return_value = make_link(id="l-1", status="fetching")
+        runs.get_by_trigger.side_effect = RuntimeError("cosmos down")
+        orchestrator._agent.run = AsyncMock(  # noqa: SLF001
+            return_value=MagicMock(text="done", usage_details=None),
+        )
+
+        await orchestrator.handle_link_change(
+            {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        saved_run = _orchestrator_run(orchestrator)
+        assert saved_run.status == "completed"
+        runs.update.assert_any_await(saved_run, saved_run.edition_id)
+
+    async def test_stalled_check_runs_in_background(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """The handler returns without waiting on the stalled-link check."""
+        links, *_ = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-1", status="submitted")
+        release = asyncio.Event()
+
+        async def _blocked_get(*_args: object) -> Link:
+            await release.wait()
+            return make_link(id="l-1", status="submitted")
+
+        links.get.side_effect = _blocked_get
+        orchestrator._agent.run = AsyncMock(  # noqa: SLF001
+            side_effect=RuntimeError("bad output"),
+        )
+
+        await orchestrator.handle_link_change(
+            {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+        )
+        links.update.assert_not_called()
+
+        release.set()
+        await asyncio.gather(*orchestrator._background_tasks)  # noqa: SLF001
+        links.update.assert_awaited_once()
+
+    async def test_leaves_advanced_link_untouched(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A link that moved past its event status is not overwritten."""
+        links, *_ = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-1", status="submitted")
+        links.get.return_value = make_link(id="l-1", status="drafted")
+        response = MagicMock()
+        response.text = "ok"
+        response.usage_details = None
+        orchestrator._agent.run = AsyncMock(return_value=response)  # noqa: SLF001
+
+        await orchestrator.handle_link_change(
+            {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+        )
+        await asyncio.gather(*orchestrator._background_tasks)  # noqa: SLF001
+
+        links.update.assert_not_called()
+
+
+def _orchestrator_run(orchestrator: PipelineOrchestrator) -> MagicMock:
+    """Return the orchestrator run handed out by the mocked RunManager."""
+    return orchestrator._runs.create_orchestrator_run.return_value  # noqa: SLF001
+
+
+def _stage_run_updates(runs: AsyncMock, orchestrator_run: object) -> list[AgentRun]:
+    """Return the stage runs written through the repository, in order."""
+    return [
+        call.args[0]
+        for call in runs.update.call_args_list
+        if call.args[0] is not orchestrator_run
+    ]
+
+
+class TestLinkFastPath:
+    """Tests for deterministic link staging without LLM routing."""
+
+    @pytest.fixture
+    def fast_orchestrator(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> PipelineOrchestrator:
+        """Enable the fast path with succeeding sub-agents."""
+        links, *_ = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-1", status="submitted")
+        links.get.return_value = make_link(id="l-1", status="drafted")
+        orchestrator._link_fast_path = True  # noqa: SLF001
+        orchestrator._agent.run = AsyncMock()  # noqa: SLF001
+        for agent in (orchestrator.fetch, orchestrator.review, orchestrator.draft):
+            agent.run = AsyncMock(return_value={"usage": {"input_token_count": 1}})
+        return orchestrator
+
+    async def test_runs_stages_in_order_without_routing(
+        self,
+        fast_orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+    ) -> None:
+        """Fetch, review and draft run directly, each recorded as a stage run."""
+        *_, runs = mock_repos
+
+        await fast_orchestrator.handle_link_change(
+            {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        await fast_orchestrator._runs.flush()  # noqa: SLF001
+
+        fast_orchestrator._agent.run.assert_not_called()  # noqa: SLF001
+        stages = [call.args[0].stage for call in runs.create.call_args_list]
+        assert stages == ["fetch", "review", "draft"]
+        saved_run = _orchestrator_run(fast_orchestrator)
+        stage_runs = _stage_run_updates(runs, saved_run)
+        assert all(run.status == "completed" for run in stage_runs)
+        assert stage_runs[0].usage == {
+            "input_tokens": 1,
+            "output_tokens": 0,
+            "total_tokens": 1,
+        }
+        assert saved_run.status == "completed"
+
+    async def test_stops_when_link_marked_failed(
+        self,
+        fast_orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A link failed by the fetch agent is not reviewed or drafted."""
+        links, *_ = mock_repos
+        links.get.return_value = make_link(id="l-1", status="failed")
+
+        await fast_orchestrator.handle_link_change(
+            {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        fast_orchestrator.fetch.run.assert_awaited_once()
+        fast_orchestrator.review.run.assert_not_called()
+        fast_orchestrator.draft.run.assert_not_called()
+
+    async def test_status_check_error_still_finishes_run(
+        self,
+        fast_orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+    ) -> None:
+        """A failed link read between stages fails the run instead of orphaning it."""
+        links, *_, runs = mock_repos
+        links.get.side_effect = RuntimeError("cosmos down")
+
+        await fast_orchestrator.handle_link_change(
+            {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        saved_run = _orchestrator_run(fast_orchestrator)
+        assert saved_run.status == "failed"
+        runs.update.assert_any_await(saved_run, saved_run.edition_id)
+        fast_orchestrator.review.run.assert_not_called()
+
+    async def test_retry_backoff_releases_agent_slot(
+        self,
+        fast_orchestrator: PipelineOrchestrator,
+    ) -> None:
+        """A stage waiting out a transient failure does not hold an agent slot."""
+        fast_orchestrator._agent_semaphore = PrioritySemaphore(1)  # noqa: SLF001
+        fast_orchestrator.fetch.run.side_effect = [
+            TimeoutError("throttled"),
+            {"usage": None},
+        ]
+        locked_during_backoff: list[bool] = []
+
+        async def _sleep(_delay: float) -> None:
+            locked_during_backoff.append(
+                fast_orchestrator._agent_semaphore.locked()  # noqa: SLF001
+            )
+
+        with patch("curate_worker.pipeline.retry.asyncio.sleep", side_effect=_sleep):
+            await fast_orchestrator.handle_link_change(
+                {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+            )
+
+        assert locked_during_backoff
+        assert not any(locked_during_backoff)
+
+    async def test_stage_error_fails_run(
+        self,
+        fast_orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+    ) -> None:
+        """A failing stage is recorded as failed and stops the pipeline."""
+        *_, runs = mock_repos
+        fast_orchestrator.review.run.side_effect = RuntimeError("bad review")
+
+        await fast_orchestrator.handle_link_change(
+            {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        await fast_orchestrator._runs.flush()  # noqa: SLF001
+
+        fast_orchestrator.draft.run.assert_not_called()
+        saved_run = _orchestrator_run(fast_orchestrator)
+        review_run = _stage_run_updates(runs, saved_run)[1]
+        assert review_run.status == "failed"
+        assert review_run.output == {"error": "bad review"}
+        assert saved_run.status == "failed"
+        assert saved_run.output == {"error": "review stage failed"}
 
 
 class TestGetEditionLock:
@@ -408,10 +961,77 @@ class TestGetEditionLock:
         orchestrator: PipelineOrchestrator,
     ) -> None:
         """The same lock object is returned for the same edition_id."""
-        lock1 = await orchestrator._get_edition_lock("ed-1")  # noqa: SLF001
-        lock2 = await orchestrator._get_edition_lock("ed-1")  # noqa: SLF001
+        lock1 = orchestrator._get_edition_lock("ed-1")  # noqa: SLF001
+        lock2 = orchestrator._get_edition_lock("ed-1")  # noqa: SLF001
         assert lock1 is lock2
 
+    async def test_locks_come_from_bounded_pool(
+        self,
+        orchestrator: PipelineOrchestrator,
+    ) -> None:
+        """Many editions share a fixed set of lock stripes."""
+        stripes = orchestrator._edition_lock_stripes  # noqa: SLF001
+        locks = {
+            id(orchestrator._get_edition_lock(f"ed-{n}"))  # noqa: SLF001
+            for n in range(1000)
+        }
+        assert locks <= {id(lock) for lock in stripes}
+        assert len(locks) > 1
+
+
+class TestFinishRun:
+    """Tests for _finish_run."""
+
+    async def test_persists_and_publishes_concurrently(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_agent_run: Callable[..., AgentRun],
+    ) -> None:
+        """The run event is published without waiting for the Cosmos write."""
+        *_, runs = mock_repos
+        order: list[str] = []
+
+        async def _slow_update(*_args: object) -> None:
+            order.append("update-start")
+            await asyncio.sleep(0)
+            order.append("update-end")
+
+        async def _publish(_run: AgentRun) -> None:
+            order.append("publish")
+
+        runs.update.side_effect = _slow_update
+        orchestrator._runs.publish_run_event.side_effect = _publish  # noqa: SLF001
+        run = make_agent_run(id="run-1", trigger_id="l-1", edition_id="ed-1")
+
+        await orchestrator._finish_run(run, "link=l-1", 0.0)  # noqa: SLF001
+
+        assert run.completed_at is not None
+        runs.update.assert_awaited_once_with(run, "ed-1")
+        assert order == ["update-start", "publish", "update-end"]
+
+
+class TestAgentConcurrency:
+    """Tests for the orchestrator agent-call semaphore."""
+
+    async def test_bounds_concurrent_agent_runs(
+        self,
+        orchestrator: PipelineOrchestrator,
+    ) -> None:
+        """No more than max_concurrency agent calls are in flight at once."""
+        orchestrator._agent_semaphore = PrioritySemaphore(2)  # noqa: SLF001
+        tracker = OverlapTracker(delay=0.01)
+        orchestrator._agent.run = tracker.returning(  # noqa: SLF001
+            MagicMock(text="done", usage_details=None),
+        )
+
+        await asyncio.gather(
+            *(orchestrator.handle_publish(f"ed-{n}") for n in range(5)),
+        )
+
+        assert tracker.peak == 2  # noqa: PLR2004
+        assert orchestrator._agent.run.await_count == 5  # noqa: PLR2004, SLF001
+
 
 class TestHandleFeedbackChangeLock:
     """Tests for handle_feedback_change edition lock serialization."""
@@ -447,6 +1067,75 @@ class TestHandleFeedbackChangeLock:
 
         assert order == ["start", "end", "start", "end"]
 
+    @pytest.mark.parametrize(
+        "document",
+        [
+            {"id": "fb-1", "edition_id": "ed-1", "resolved": True},
+            {"id": "fb-1", "edition_id": "", "resolved": False},
+            {"id": "fb-1", "resolved": False},
+            {"id": "", "edition_id": "ed-1", "resolved": False},
+            {"edition_id": "ed-1", "resolved": False},
+        ],
+    )
+    async def test_skips_without_lock_for_noop_events(
+        self,
+        orchestrator: PipelineOrchestrator,
+        document: dict[str, object],
+    ) -> None:
+        """Resolved or malformed feedback returns before taking any lock."""
+        orchestrator._agent.run = AsyncMock()  # noqa: SLF001
+
+        with patch.object(orchestrator, "_get_edition_lock") as get_lock:
+            await orchestrator.handle_feedback_change(document)
+
+        orchestrator._agent.run.assert_not_called()  # noqa: SLF001
+        get_lock.assert_not_called()
+
+    async def test_replayed_feedback_version_runs_once(
+        self,
+        orchestrator: PipelineOrchestrator,
+    ) -> None:
+        """Duplicate deliveries of one feedback version invoke the agent once."""
+        response = MagicMock(text="done", usage_details=None)
+        orchestrator._agent.run = AsyncMock(return_value=response)  # noqa: SLF001
+        document = {
+            "id": "fb-1",
+            "edition_id": "ed-1",
+            "resolved": False,
+            "_etag": '"v1"',
+        }
+
+        await asyncio.gather(
+            orchestrator.handle_feedback_change(document),
+            orchestrator.handle_feedback_change(dict(document)),
+        )
+        await orchestrator.handle_feedback_change({**document, "_etag": '"v2"'})
+
+        assert orchestrator._agent.run.await_count == 2  # noqa: PLR2004, SLF001
+
+    async def test_replay_retries_failed_feedback(
+        self,
+        orchestrator: PipelineOrchestrator,
+    ) -> None:
+        """A version whose run failed is handled again when it is replayed."""
+        response = MagicMock(text="done", usage_details=None)
+        orchestrator._agent.run = AsyncMock(  # noqa: SLF001
+            side_effect=[RuntimeError("llm down"), response],
+        )
+        document = {
+            "id": "fb-1",
+            "edition_id": "ed-1",
+            "resolved": False,
+            "_etag": '"v1"',
+        }
+
+        await orchestrator.handle_feedback_change(document)
+        await orchestrator.handle_feedback_change(dict(document))
+        await orchestrator.handle_feedback_change(dict(document))
+
+        assert orchestrator._agent.run.await_count == 2  # noqa: PLR2004, SLF001
+        assert orchestrator._runs.create_orchestrator_run.await_count == 2  # noqa: PLR2004, SLF001
+
 
 class TestHandlePublishFailure:
     """Tests for handle_publish error handling."""
@@ -547,3 +1236,257 @@ class TestSubAgentUsageCapture:
         await orchestrator._fetch_tool(task="fetch this")  # noqa: SLF001
 
         assert orchestrator._last_stage_usage is None  # noqa: SLF001
+
+
+class TestLinkUpdateDebounce:
+    """Tests for debounced link-row publication."""
+
+    async def test_burst_of_completions_renders_once(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """Several schedules for one link collapse into a single row event."""
+        links, *_, runs = mock_repos
+        links.get.return_value = make_link(id="l-1", status="reviewed")
+        runs.get_by_trigger.return_value = []
+
+        with patch("curate_worker.pipeline.tools._LINK_UPDATE_DEBOUNCE_SECONDS", 0):
+            for _ in range(3):
+                orchestrator._schedule_link_update("l-1")  # noqa: SLF001
+            await orchestrator.close()
+
+        links.get.assert_awaited_once_with("l-1", "l-1")
+        orchestrator._events.publish.assert_awaited_once()  # noqa: SLF001
+        assert orchestrator._events.publish.call_args.args[0] == "link-update"  # noqa: SLF001
+        assert orchestrator._pending_link_updates == {}  # noqa: SLF001
+
+    async def test_close_waits_for_committed_refresh(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A refresh past its debounce stays referenced and close() awaits it."""
+        links, *_, runs = mock_repos
+        runs.get_by_trigger.return_value = []
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def _blocked_get(*_args: object) -> Link:
+            entered.set()
+            await release.wait()
+            return make_link(id="l-1", status="reviewed")
+
+        links.get.side_effect = _blocked_get
+
+        with patch("curate_worker.pipeline.tools._LINK_UPDATE_DEBOUNCE_SECONDS", 0):
+            orchestrator._schedule_link_update("l-1")  # noqa: SLF001
+            await entered.wait()
+            assert orchestrator._pending_link_updates == {}  # noqa: SLF001
+            assert len(orchestrator._background_tasks) == 1  # noqa: SLF001
+
+            closing = asyncio.create_task(orchestrator.close())
+            await asyncio.sleep(0)
+            assert not closing.done()
+            release.set()
+            await closing
+
+        orchestrator._events.publish.assert_awaited_once()  # noqa: SLF001
+        assert orchestrator._background_tasks == set()  # noqa: SLF001
+
+    async def test_record_stage_complete_schedules_row_update(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_agent_run: Callable[..., AgentRun],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """Stage completion publishes the run event now and the row later."""
+        links, *_, runs = mock_repos
+        runs.get.return_value = make_agent_run(id="run-1", trigger_id="l-1")
+        runs.get_by_trigger.return_value = []
+        links.get.return_value = make_link(id="l-1", status="reviewed")
+
+        with patch("curate_worker.pipeline.tools._LINK_UPDATE_DEBOUNCE_SECONDS", 0):
+            await orchestrator.record_stage_complete(
+                "run-1", "l-1", "ed-1", "completed"
+            )
+            await orchestrator._runs.flush()  # noqa: SLF001
+            events = [c.args[0] for c in orchestrator._events.publish.call_args_list]  # noqa: SLF001
+            assert events == ["agent-run-complete"]
+            await orchestrator.close()
+
+        events = [c.args[0] for c in orchestrator._events.publish.call_args_list]  # noqa: SLF001
+        assert events == ["agent-run-complete", "link-update"]
+
+
+class TestInFlightLinkRuns:
+    """Tests for serving link-row runs from memory while a link is in flight."""
+
+    async def test_row_refresh_uses_tracked_runs(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_agent_run: Callable[..., AgentRun],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """Stage runs join the tracked list and the row skips get_by_trigger."""
+        links, *_, runs = mock_repos
+        links.get.return_value = make_link(id="l-1", status="fetching")
+        orchestrator._link_runs["l-1"] = [make_agent_run(trigger_id="l-1")]  # noqa: SLF001
+
+        stage_run = await orchestrator._start_stage("fetch", "l-1", "ed-1")  # noqa: SLF001
+        with patch("curate_worker.pipeline.tools._LINK_UPDATE_DEBOUNCE_SECONDS", 0):
+            await orchestrator._publish_link_update("l-1")  # noqa: SLF001
+
+        assert orchestrator._link_runs["l-1"][-1] is stage_run  # noqa: SLF001
+        runs.get_by_trigger.assert_not_awaited()
+        row = orchestrator._events.publish.call_args.args[1]  # noqa: SLF001
+        assert "(2 runs)" in row
+
+    async def test_tracking_ends_with_processing(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """Runs are seeded from Cosmos on claim and dropped when done."""
+        links, *_, runs = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-1", status="submitted")
+        runs.get_by_trigger.return_value = []
+        orchestrator._agent.run = AsyncMock(return_value=None)  # noqa: SLF001
+
+        await orchestrator.handle_link_change(
+            {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        runs.get_by_trigger.assert_any_await("l-1")
+        assert orchestrator._link_runs == {}  # noqa: SLF001
+
+    async def test_seeded_history_skips_new_run(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_agent_run: Callable[..., AgentRun],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A history read that already sees the new run does not count it twice."""
+        links, *_, runs = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-1", status="submitted")
+        prior = make_agent_run(id="run-old", trigger_id="l-1")
+        run = _orchestrator_run(orchestrator)
+        run.id = "run-new"
+        runs.get_by_trigger.return_value = [
+            make_agent_run(id="run-new", trigger_id="l-1"),
+            prior,
+        ]
+        seen: list[list[AgentRun]] = []
+
+        async def _run(*_args: object, **_kwargs: object) -> None:
+            seen.append(list(orchestrator._link_runs["l-1"]))  # noqa: SLF001
+
+        orchestrator._agent.run = AsyncMock(side_effect=_run)  # noqa: SLF001
+
+        await orchestrator.handle_link_change(
+            {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        assert seen == [[prior, run]]
+
+
+class TestOpenStageRuns:
+    """Tests for reusing runs between record_stage_start and _complete."""
+
+    async def test_complete_reuses_started_run(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+    ) -> None:
+        """Completing a run started by this worker skips the Cosmos read."""
+        *_, runs = mock_repos
+        started = json.loads(
+            await orchestrator.record_stage_start("fetch", "l-1", "ed-1")
+        )
+
+        await orchestrator.record_stage_complete(
+            started["run_id"], "l-1", "ed-1", "completed"
+        )
+        await orchestrator._runs.flush()  # noqa: SLF001
+
+        runs.get.assert_not_awaited()
+        assert runs.update.await_args.args[0].id == started["run_id"]
+        assert orchestrator._open_stage_runs == {}  # noqa: SLF001
+
+    async def test_complete_falls_back_to_repository(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_agent_run: Callable[..., AgentRun],
+    ) -> None:
+        """Runs not started on this worker are read from the repository."""
+        *_, runs = mock_repos
+        runs.get.return_value = make_agent_run(id="run-9", trigger_id="l-1")
+
+        await orchestrator.record_stage_complete("run-9", "l-1", "ed-1", "completed")
+
+        runs.get.assert_awaited_once_with("run-9", "ed-1")
+
+    async def test_fallback_reads_created_run(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_agent_run: Callable[..., AgentRun],
+    ) -> None:
+        """An evicted run is read back after its create has already landed."""
+        *_, runs = mock_repos
+        calls: list[str] = []
+        runs.create.side_effect = lambda *_: calls.append("create")
+        orchestrator._link_runs["l-1"] = []  # noqa: SLF001
+        started = json.loads(
+            await orchestrator.record_stage_start("fetch", "l-1", "ed-1")
+        )
+        orchestrator._open_stage_runs.clear()  # noqa: SLF001
+        loaded = make_agent_run(id=started["run_id"], trigger_id="l-1")
+
+        async def _get(*_args: object) -> AgentRun:
+            calls.append("get")
+            return loaded
+
+        runs.get.side_effect = _get
+
+        await orchestrator.record_stage_complete(
+            started["run_id"], "l-1", "ed-1", "completed"
+        )
+
+        assert calls[:2] == ["create", "get"]
+        (cached,) = orchestrator._link_runs["l-1"]  # noqa: SLF001
+        assert cached is loaded
+
+    async def test_full_cache_evicts_only_the_oldest_run(
+        self,
+        orchestrator: PipelineOrchestrator,
+    ) -> None:
+        """Reaching the cap drops the oldest open run, not every live one."""
+        with patch("curate_worker.pipeline.tools._MAX_OPEN_STAGE_RUNS", 2):
+            started = [
+                json.loads(
+                    await orchestrator.record_stage_start("fetch", f"l-{n}", "ed-1")
+                )["run_id"]
+                for n in range(3)
+            ]
+
+        assert list(orchestrator._open_stage_runs) == started[1:]  # noqa: SLF001
+
+    async def test_finishing_a_stage_drops_its_open_run(
+        self,
+        orchestrator: PipelineOrchestrator,
+    ) -> None:
+        """Any path that finishes a stage run removes it from the cache."""
+        run = await orchestrator._start_stage("fetch", "l-1", "ed-1")  # noqa: SLF001
+        orchestrator._open_stage_runs[run.id] = run  # noqa: SLF001
+
+        await orchestrator._finish_stage(run, "l-1", failed=False)  # noqa: SLF001
+
+        assert orchestrator._open_stage_runs == {}  # noqa: SLF001
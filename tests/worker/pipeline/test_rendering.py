@@ -0,0 +1,126 @@
+"""Tests for SSE link-row rendering helpers."""
+
+from __future__ import annotations
+
+import html
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from curate_worker.pipeline.rendering import (
+    _render_link_cells,
+    _render_progress,
+    escape,
+    render_link_row,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from curate_common.models.agent_run import AgentRun
+    from curate_common.models.link import Link
+
+
+class TestEscape:
+    """Tests for the translate-based HTML escape."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "",
+            "plain text",
+            "https://example.com/?a=1&b=2",
+            "<script>alert('x')</script>",
+            'say "hi" & <bye>',
+        ],
+    )
+    def test_matches_stdlib_escape(self, value: str) -> None:
+        """Output is identical to html.escape with quoting enabled."""
+        assert escape(value) == html.escape(value)
+
+
+class TestRenderLinkRow:
+    """Tests for render_link_row."""
+
+    def test_escapes_link_fields(self, make_link: Callable[..., Link]) -> None:
+        """User-controlled link fields are HTML-escaped in the row."""
+        link = make_link(
+            id="l-1",
+            url="https://example.com/?q=<x>",
+            title='A "quoted" & <b>bold</b> title',
+        )
+
+        row = render_link_row(link, [])
+
+        assert 'id="link-l-1"' in row
+        assert "https://example.com/?q=&lt;x&gt;" in row
+        assert "A &quot;quoted&quot; &amp; &lt;b&gt;bold&lt;/b&gt; title" in row
+        assert "<b>" not in row
+
+    def test_truncates_long_urls(self, make_link: Callable[..., Link]) -> None:
+        """URLs longer than the display limit are truncated with an ellipsis."""
+        url = "https://example.com/" + "a" * 80
+        link = make_link(url=url)
+
+        row = render_link_row(link, [])
+
+        assert f">{url[:47]}...</a>" in row
+        assert f'href="{url}"' in row
+
+    def test_renders_latest_run_progress(
+        self,
+        make_link: Callable[..., Link],
+        make_agent_run: Callable[..., AgentRun],
+    ) -> None:
+        """The progress cell reflects the latest run and the run count."""
+        started = datetime(2025, 1, 1, tzinfo=UTC)
+        link = make_link()
+        runs = [
+            make_agent_run(stage="fetch", started_at=started),
+            make_agent_run(stage="review", started_at=started),
+        ]
+
+        row = render_link_row(link, runs)
+
+        assert "agent-indicator-dot-running" in row
+        assert '<span class="stage-review">review</span>' in row
+        assert "(2 runs)" in row
+
+    def test_renders_placeholder_without_runs(
+        self, make_link: Callable[..., Link]
+    ) -> None:
+        """A muted dash is rendered when the link has no runs."""
+        row = render_link_row(make_link(), [])
+
+        assert '<span class="agent-indicator" style="color: var(--text-muted);">' in row
+        assert "run)" not in row
+
+    def test_reuses_rendered_progress(
+        self,
+        make_link: Callable[..., Link],
+        make_agent_run: Callable[..., AgentRun],
+    ) -> None:
+        """Rows with the same run state share one rendered progress cell."""
+        started = datetime(2025, 1, 1, tzinfo=UTC)
+        runs = [make_agent_run(stage="draft", started_at=started)]
+        _render_progress.cache_clear()
+
+        render_link_row(make_link(id="a"), runs)
+        render_link_row(make_link(id="b"), runs)
+
+        assert _render_progress.cache_info().hits == 1
+
+    def test_reuses_link_cells_until_link_changes(
+        self, make_link: Callable[..., Link]
+    ) -> None:
+        """Link HTML is reused across run updates and refreshed on change."""
+        _render_link_cells.cache_clear()
+        link = make_link(id="l-1", status="submitted")
+
+        render_link_row(link, [])
+        render_link_row(link, [])
+        row = render_link_row(make_link(id="l-1", status="reviewed"), [])
+
+        assert _render_link_cells.cache_info().hits == 1
+        assert "badge-reviewed" in row
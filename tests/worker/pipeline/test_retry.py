@@ -0,0 +1,118 @@
+"""Tests for transient-failure retry helpers."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from curate_worker.pipeline.retry import (
+    MAX_ATTEMPTS,
+    RETRY_MAX_DELAY,
+    is_transient_error,
+    retry_delay,
+    retry_transient,
+)
+
+_SLEEP_PATCH = "curate_worker.pipeline.retry.asyncio.sleep"
+
+
+class _StatusError(Exception):
+    """Provider-style error carrying an HTTP status code."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def _wrapped(cause: BaseException) -> RuntimeError:
+    """Wrap an exception the way chat clients chain provider errors."""
+    exc = RuntimeError("service failed")
+    exc.__cause__ = cause
+    return exc
+
+
+class TestIsTransientError:
+    """Tests for is_transient_error."""
+
+    @pytest.mark.parametrize("status_code", [408, 429, 500, 503])
+    def test_transient_status_codes(self, status_code: int) -> None:
+        """Rate limits and server errors are retried."""
+        assert is_transient_error(_StatusError(status_code))
+
+    @pytest.mark.parametrize("status_code", [400, 401, 404])
+    def test_client_status_codes_are_not_transient(self, status_code: int) -> None:
+        """Client errors would fail again, so they are not retried."""
+        assert not is_transient_error(_StatusError(status_code))
+
+    def test_timeouts_and_transport_errors(self) -> None:
+        """Network-level failures are transient."""
+        assert is_transient_error(TimeoutError())
+        assert is_transient_error(httpx.ConnectError("refused"))
+
+    def test_inspects_cause_chain(self) -> None:
+        """Provider errors wrapped by the chat client are still detected."""
+        assert is_transient_error(_wrapped(_StatusError(429)))
+        assert not is_transient_error(_wrapped(_StatusError(400)))
+
+    def test_plain_errors_are_not_transient(self) -> None:
+        """Logical failures are not retried."""
+        assert not is_transient_error(RuntimeError("bad output"))
+
+
+class TestRetryDelay:
+    """Tests for retry_delay."""
+
+    @pytest.mark.parametrize(("attempt", "base"), [(1, 2.0), (2, 4.0), (3, 8.0)])
+    def test_doubles_per_attempt_within_jitter(self, attempt: int, base: float) -> None:
+        """Backoff grows exponentially, jittered by up to 50% either way."""
+        assert base * 0.5 <= retry_delay(attempt) <= base * 1.5
+
+    def test_caps_delay(self) -> None:
+        """Late attempts never wait longer than the jittered cap."""
+        assert retry_delay(20) <= RETRY_MAX_DELAY * 1.5
+
+    def test_jitter_spreads_delays(self) -> None:
+        """Simultaneous failures do not all retry at the same instant."""
+        with patch(
+            "curate_worker.pipeline.retry.random.uniform", side_effect=[0.5, 1.5]
+        ):
+            assert retry_delay(1) != retry_delay(1)
+
+
+class TestRetryTransient:
+    """Tests for retry_transient."""
+
+    async def test_returns_after_transient_failure(self) -> None:
+        """A transient failure is retried and the next result returned."""
+        call = AsyncMock(side_effect=[TimeoutError(), "ok"])
+        with patch(_SLEEP_PATCH, new_callable=AsyncMock) as sleep:
+            result = await retry_transient("fetch", call)
+
+        assert result == "ok"
+        assert call.await_count == 2  # noqa: PLR2004
+        sleep.assert_awaited_once()
+
+    async def test_raises_non_transient_immediately(self) -> None:
+        """Non-transient errors propagate without retrying."""
+        call = AsyncMock(side_effect=ValueError("bad"))
+        with (
+            patch(_SLEEP_PATCH, new_callable=AsyncMock) as sleep,
+            pytest.raises(ValueError, match="bad"),
+        ):
+            await retry_transient("draft", call)
+
+        assert call.await_count == 1
+        sleep.assert_not_awaited()
+
+    async def test_raises_after_max_attempts(self) -> None:
+        """The last transient error propagates once attempts are exhausted."""
+        call = AsyncMock(side_effect=TimeoutError("slow"))
+        with (
+            patch(_SLEEP_PATCH, new_callable=AsyncMock),
+            pytest.raises(TimeoutError, match="slow"),
+        ):
+            await retry_transient("review", call)
+
+        assert call.await_count == MAX_ATTEMPTS
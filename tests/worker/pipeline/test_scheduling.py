@@ -0,0 +1,73 @@
+"""Tests for the priority-aware agent semaphore."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from curate_worker.pipeline.scheduling import (
+    FEEDBACK_PRIORITY,
+    LINK_PRIORITY,
+    PUBLISH_PRIORITY,
+    PrioritySemaphore,
+)
+
+
+async def _hold(sem: PrioritySemaphore, priority: int, order: list[int]) -> None:
+    async with sem.acquire(priority):
+        order.append(priority)
+
+
+class TestPrioritySemaphore:
+    """Tests for PrioritySemaphore."""
+
+    async def test_admits_most_urgent_waiter_first(self) -> None:
+        """Queued publish and feedback work runs before queued link work."""
+        sem = PrioritySemaphore(1)
+        order: list[int] = []
+
+        async with sem.acquire():
+            tasks = [
+                asyncio.create_task(_hold(sem, priority, order))
+                for priority in (LINK_PRIORITY, FEEDBACK_PRIORITY, PUBLISH_PRIORITY)
+            ]
+            await asyncio.sleep(0)
+            assert sem.locked()
+        await asyncio.gather(*tasks)
+
+        assert order == [PUBLISH_PRIORITY, FEEDBACK_PRIORITY, LINK_PRIORITY]
+        assert not sem.locked()
+
+    async def test_equal_priority_is_first_come_first_served(self) -> None:
+        """Waiters with the same priority are admitted in arrival order."""
+        sem = PrioritySemaphore(1)
+        order: list[str] = []
+
+        async def _named(name: str) -> None:
+            async with sem.acquire(LINK_PRIORITY):
+                order.append(name)
+
+        async with sem.acquire():
+            tasks = [asyncio.create_task(_named(name)) for name in "abc"]
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        assert order == ["a", "b", "c"]
+
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """Cancelling a queued waiter leaves the slot for the next one."""
+        sem = PrioritySemaphore(1)
+        order: list[int] = []
+
+        async with sem.acquire():
+            cancelled = asyncio.create_task(_hold(sem, PUBLISH_PRIORITY, order))
+            waiting = asyncio.create_task(_hold(sem, LINK_PRIORITY, order))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+        await waiting
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert order == [LINK_PRIORITY]
+        assert not sem.locked()
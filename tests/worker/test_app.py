@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from curate_worker.app import run
+from curate_worker.app import _new_event_loop, main, run
 
 
 @pytest.mark.unit
@@ -78,6 +79,7 @@ async def test_run_wires_event_and_command_channels() -> None:
     processor = MagicMock()
     processor.stop = AsyncMock()
     processor.orchestrator.handle_publish = AsyncMock()
+    processor.orchestrator.close = AsyncMock()
     command_consumer = MagicMock()
     command_consumer.start = AsyncMock()
     command_consumer.stop = AsyncMock()
@@ -120,3 +122,39 @@ async def test_run_wires_event_and_command_channels() -> None:
         settings.servicebus,
         on_publish=processor.orchestrator.handle_publish,
     )
+    processor.orchestrator.close.assert_awaited_once()
+
+
+@pytest.mark.unit
+def test_main_uses_worker_loop_factory() -> None:
+    """The worker entrypoint runs on the tuned event loop."""
+    with patch("curate_worker.app.asyncio.run") as mock_run:
+        main()
+
+    mock_run.call_args.args[0].close()
+    assert mock_run.call_args.kwargs["loop_factory"] is _new_event_loop
+
+
+@pytest.mark.unit
+def test_new_event_loop_uses_uvloop_when_installed() -> None:
+    """The worker loop is created by uvloop when it is importable."""
+    uvloop = pytest.importorskip("uvloop")
+
+    loop = _new_event_loop()
+    try:
+        assert isinstance(loop, uvloop.Loop)
+        assert loop.get_task_factory() is asyncio.eager_task_factory
+    finally:
+        loop.close()
+
+
+@pytest.mark.unit
+def test_new_event_loop_falls_back_without_uvloop() -> None:
+    """The asyncio default loop is used when uvloop is unavailable."""
+    with patch.dict("sys.modules", {"uvloop": None}):
+        loop = _new_event_loop()
+    try:
+        assert type(loop).__module__.startswith("asyncio")
+        assert loop.get_task_factory() is asyncio.eager_task_factory
+    finally:
+        loop.close()